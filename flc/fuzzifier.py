@@ -121,9 +121,10 @@ class Fuzzifier:
                 fuzzified_inputs[set_name] = degree
 
         # Format and log after collecting all outputs
-        formatted_output = {k: f"{v:.3f}" for k, v in fuzzified_inputs.items()}
-        if input_name == "omega": input_name = input_name.upper()
-        fuzzifier_log.debug(
-            "Fuzzified %s=  %.3f -> %s", input_name, crisp_value, formatted_output
-        )
+        if fuzzifier_log.isEnabledFor(logging.DEBUG):
+            formatted_output = {k: f"{v:.3f}" for k, v in fuzzified_inputs.items()}
+            if input_name == "omega": input_name = input_name.upper()
+            fuzzifier_log.debug(
+                "Fuzzified %s=  %.3f -> %s", input_name, crisp_value, formatted_output
+            )
         return fuzzified_inputs
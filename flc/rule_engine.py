@@ -99,12 +99,14 @@ class RuleEngine:
                 plot=False,
             )
 
-        # Log fuzzified values for debugging
-        rounded = {k: round(v, 3) for k, v in fuzzified_theta.items()}
-        rule_engine_log.info("Theta: %.3f, fuzzy_Theta=%s", crisp_theta, rounded)
+        # Log fuzzified values for debugging (rounded dicts only built when logged)
+        if rule_engine_log.isEnabledFor(logging.INFO):
+            rounded = {k: round(v, 3) for k, v in fuzzified_theta.items()}
+            rule_engine_log.info("Theta: %.3f, fuzzy_Theta=%s", crisp_theta, rounded)
 
-        rounded = {k: round(v, 3) for k, v in fuzzified_omega.items()}
-        rule_engine_log.info("Omega: %.3f, fuzzy_Omega=%s", crisp_omega, rounded)
+            rounded = {k: round(v, 3) for k, v in fuzzified_omega.items()}
+            rule_engine_log.info("Omega: %.3f, fuzzy_Omega=%s", crisp_omega, rounded)
+        wz_debug = WZ_log.isEnabledFor(logging.DEBUG)
 
         # Collect active rules
         active_rules_output = []
@@ -135,25 +137,26 @@ class RuleEngine:
                 active_rules_output.append((firing_strength, z))
 
                 # Detailed rule logging
-                WZ_log.debug(
-                    "Rule# %d (theta_set=%s, omega_set=%s) "
-                    "Z=%.3f | theta_term=%.3f | omega_term=%.3f | bias=%.3f",
-                    i,
-                    theta_set,
-                    omega_set,
-                    z,
-                    consequent["theta_coeff"] * crisp_theta,
-                    consequent["omega_coeff"] * crisp_omega,
-                    consequent["bias"],
-                )
-                WZ_log.debug(
-                    "crisp_theta= %.3f, degree_theta= %.3f, degree_omega= %.3f, W= %.3f",
-                    crisp_theta,
-                    degree_theta,
-                    degree_omega,
-                    firing_strength,
-                )
-            else:
+                if wz_debug:
+                    WZ_log.debug(
+                        "Rule# %d (theta_set=%s, omega_set=%s) "
+                        "Z=%.3f | theta_term=%.3f | omega_term=%.3f | bias=%.3f",
+                        i,
+                        theta_set,
+                        omega_set,
+                        z,
+                        consequent["theta_coeff"] * crisp_theta,
+                        consequent["omega_coeff"] * crisp_omega,
+                        consequent["bias"],
+                    )
+                    WZ_log.debug(
+                        "crisp_theta= %.3f, degree_theta= %.3f, degree_omega= %.3f, W= %.3f",
+                        crisp_theta,
+                        degree_theta,
+                        degree_omega,
+                        firing_strength,
+                    )
+            elif wz_debug:
                 WZ_log.debug("Rule# %d W= %.3f", i, firing_strength)
 
         return active_rules_output
@@ -15,6 +15,7 @@ The returned host is "pigpio-like" and implements at least:
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
 from typing import Any, Dict, Optional
@@ -22,6 +23,9 @@ from typing import Any, Dict, Optional
 _i2c_log = logging.getLogger("imu.i2c")
 
 
+# Cached on the first call rather than read at import: PYTEST_CURRENT_TEST
+# is only set while a test runs, not while pytest imports test modules
+@functools.lru_cache(maxsize=None)
 def _running_under_pytest() -> bool:
     return "PYTEST_CURRENT_TEST" in os.environ
 
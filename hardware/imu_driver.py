@@ -172,7 +172,7 @@ class IMU_Driver:
         self.theta_range_rad = float(self.controller_params.get("THETA_RANGE_RAD", math.pi))
 
         # Theta offset applied
-        self.theta_zero_rad = float(controller_params.get("THETA_ZERO_RAD", 0.125))
+        self.theta_zero_rad = float(self.controller_params.get("THETA_ZERO_RAD", 0.125))
 
         # Linear gain applied to theta before normalization
         self.theta_gain = float(self.controller_params.get("THETA_GAIN", 1.0))
@@ -188,40 +188,22 @@ class IMU_Driver:
         self.alpha_acc = _iir_alpha(self.sample_rate_hz, self.accel_cutoff_hz)
         self.alpha_omega = _iir_alpha(self.sample_rate_hz, self.omega_cutoff_hz)
 
+        # Keys below may come from either table; controller_params wins
+        cp = {**self.iir_params, **self.controller_params}
+
         # --- MPU6050 sensitivity defaults (±250 dps -> 131 LSB/(deg/s))
-        self.gyro_lsb_per_dps = float(
-            self.controller_params.get("GYRO_LSB_PER_DPS",
-            self.iir_params.get("GYRO_LSB_PER_DPS", 131.0))
-        )
+        self.gyro_lsb_per_dps = float(cp.get("GYRO_LSB_PER_DPS", 131.0))
 
         # Raw counts that represent ~1g magnitude (MPU6050 at ±2g is 16384 LSB/g)
-        self.accel_1g_raw = float(
-            self.controller_params.get("ACCEL_1G_RAW",
-            self.iir_params.get("ACCEL_1G_RAW", 16384.0))
-        )
+        self.accel_1g_raw = float(cp.get("ACCEL_1G_RAW", 16384.0))
 
         # --- Optional features
-        self.do_gyro_bias_cal = bool(
-            self.controller_params.get("DO_GYRO_BIAS_CAL",
-            self.iir_params.get("DO_GYRO_BIAS_CAL", True))
-        )
-        self.gyro_bias_samples = int(
-            self.controller_params.get("GYRO_BIAS_SAMPLES",
-            self.iir_params.get("GYRO_BIAS_SAMPLES", 200))
-        )
+        self.do_gyro_bias_cal = bool(cp.get("DO_GYRO_BIAS_CAL", True))
+        self.gyro_bias_samples = int(cp.get("GYRO_BIAS_SAMPLES", 200))
 
-        self.use_complementary = bool(
-            self.controller_params.get("USE_COMPLEMENTARY",
-            self.iir_params.get("USE_COMPLEMENTARY", False))
-        )
-        self.comp_alpha = float(
-            self.controller_params.get("COMP_ALPHA",
-            self.iir_params.get("COMP_ALPHA", 0.98))
-        )
-        self.accel_mag_tol_g = float(
-            self.controller_params.get("ACCEL_MAG_TOL_G",
-            self.iir_params.get("ACCEL_MAG_TOL_G", 0.15))
-        )
+        self.use_complementary = bool(cp.get("USE_COMPLEMENTARY", False))
+        self.comp_alpha = float(cp.get("COMP_ALPHA", 0.98))
+        self.accel_mag_tol_g = float(cp.get("ACCEL_MAG_TOL_G", 0.15))
 
         # Filter state
         self._ax_lp = 0.0
@@ -331,15 +313,16 @@ class IMU_Driver:
         theta_norm = theta_rads_eff / self.theta_range_rad
         theta_norm = max(-1.0, min(1.0, theta_norm))
 
-        imu_log.debug(
-            "raw=(AX=%d AY=%d AZ=%d GY=%d) | lp=(AX=%.1f AZ=%.1f) | "
-            "θ_acc=%.3f θ=%.3f (norm=%.4f) | ω_norm=%.4f | |a|=%.2fg trust=%s",
-            ax, ay, az, gy,
-            self._ax_lp, self._az_lp,
-            theta_acc, theta_rads, theta_norm,
-            omega_norm,
-            amag_g, accel_trust,
-        )
+        if imu_log.isEnabledFor(logging.DEBUG):
+            imu_log.debug(
+                "raw=(AX=%d AY=%d AZ=%d GY=%d) | lp=(AX=%.1f AZ=%.1f) | "
+                "θ_acc=%.3f θ=%.3f (norm=%.4f) | ω_norm=%.4f | |a|=%.2fg trust=%s",
+                ax, ay, az, gy,
+                self._ax_lp, self._az_lp,
+                theta_acc, theta_rads, theta_norm,
+                omega_norm,
+                amag_g, accel_trust,
+            )
 
         return theta_norm, omega_norm
 
@@ -20,6 +20,7 @@ Notes
 from __future__ import annotations
 
 import logging
+import struct
 import time
 from typing import Optional, Protocol, cast
 
@@ -27,6 +28,9 @@ from hardware import i2c_driver
 
 _log = logging.getLogger("imu.mpu")
 
+# ACCEL_XOUT_H..GYRO_ZOUT_L: three accel words, TEMP (skipped), three gyro words
+_AXES_BLOCK = struct.Struct(">3h2x3h")
+
 
 # --------------------------------------------------------------------------
 # Minimal I2C host interface for static type checkers (Pylance/Pyright)
@@ -76,6 +80,9 @@ class MPU6050Driver:
         self._h: int = -1
         self._closed: bool = False
 
+        # Axis block buffer, refilled in place by every read_all_axes()
+        self._axes_buf = bytearray(_AXES_BLOCK.size)
+
         # Open handle (support both pigpio signature and some mock signatures)
         try:
             self._h = self._pi.i2c_open(self._bus, self._addr, self._flags)
@@ -113,10 +120,12 @@ class MPU6050Driver:
 
     def _read_block(self, reg: int, length: int) -> bytes:
         """Read bytes one-by-one for maximum compatibility across adapters and mocks."""
-        out = bytearray()
-        for i in range(int(length)):
-            out.append(self._read_byte(reg + i) & 0xFF)
-        return bytes(out)
+        return bytes([self._read_byte(reg + i) & 0xFF for i in range(int(length))])
+
+    def _read_into(self, reg: int, buf: bytearray) -> None:
+        """_read_block() into an existing buffer (no per-read allocation)."""
+        for i in range(len(buf)):
+            buf[i] = self._read_byte(reg + i) & 0xFF
 
     # ----------------------------------------------------------------------
     def _init_device(self) -> None:
@@ -153,17 +162,9 @@ class MPU6050Driver:
 
         MPU6050 register stream is big-endian per axis.
         """
-        block = self._read_block(MPU_ACCEL_XOUT_H, 14)
-
-        ax = int.from_bytes(block[0:2], "big", signed=True)
-        ay = int.from_bytes(block[2:4], "big", signed=True)
-        az = int.from_bytes(block[4:6], "big", signed=True)
-
-        gx = int.from_bytes(block[8:10], "big", signed=True)
-        gy = int.from_bytes(block[10:12], "big", signed=True)
-        gz = int.from_bytes(block[12:14], "big", signed=True)
-
-        return ax, ay, az, gx, gy, gz
+        buf = self._axes_buf
+        self._read_into(MPU_ACCEL_XOUT_H, buf)
+        return _AXES_BLOCK.unpack(buf)
 
     # ----------------------------------------------------------------------
     def close(self) -> None:
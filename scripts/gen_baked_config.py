@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+# gen_baked_config.py
+"""
+Bake config/sim_config.toml (and the FLC config it points to) into
+simulation/_baked_config.py as Python literals.
+
+With USE_BAKED_CONFIG=1 in the environment, load_simulation_config() reads
+these constants instead of parsing TOML. Re-run after editing either file:
+
+    python scripts/gen_baked_config.py [path/to/sim_config.toml]
+"""
+import os
+import pprint
+import sys
+import tomllib
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+OUT_PATH = os.path.join(REPO_ROOT, "simulation", "_baked_config.py")
+
+
+def _read(path: str) -> dict:
+    with open(path, "rb") as f:
+        return tomllib.load(f)
+
+
+def render(sim_path: str) -> str:
+    """Source text of the baked module for the given sim config."""
+    sim_path = os.path.realpath(sim_path)
+    sim_cfg = _read(sim_path)
+
+    flc_cfg = None
+    flc_path = sim_cfg.get("controller", {}).get("FLC_CONFIG_PATH")
+    if flc_path:
+        # Relative to the repo root, as central_config resolves it
+        if not os.path.isabs(flc_path):
+            flc_path = os.path.join(REPO_ROOT, flc_path)
+        flc_cfg = _read(flc_path)
+
+    return "\n".join([
+        "# _baked_config.py",
+        f"# Generated by scripts/gen_baked_config.py from {os.path.relpath(sim_path, REPO_ROOT)}.",
+        "# Do not edit; re-run the generator after changing the TOML files.",
+        "",
+        'inf = float("inf")',
+        'nan = float("nan")',
+        "",
+        f"SOURCE_PATH = {sim_path!r}",
+        "",
+        f"SIM_CONFIG = {pprint.pformat(sim_cfg, sort_dicts=False)}",
+        "",
+        f"FLC_CONFIG = {pprint.pformat(flc_cfg, sort_dicts=False)}",
+        "",
+    ])
+
+
+def main(argv) -> int:
+    sim_path = argv[1] if len(argv) > 1 else os.path.join(REPO_ROOT, "config", "sim_config.toml")
+    with open(OUT_PATH, "w", encoding="utf-8") as f:
+        f.write(render(sim_path))
+    print(f"Wrote {os.path.relpath(OUT_PATH, REPO_ROOT)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv))
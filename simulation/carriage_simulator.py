@@ -11,20 +11,27 @@ assembly, including:
     • Rigid-body inertia:        I * alpha = tau_total
     • Gravity torque:            tau_g = m * g * r * sin(theta)
     • Viscous damping:           -b * omega
-    • Motor model:
-          - Armature resistance
-          - Back-EMF
-          - Current saturation
-          - Torque saturation
-          - Gear reduction + efficiency
-
-The simulator integrates state using semi-implicit Euler:
-    omega ← omega + alpha * dt
+    • Motor model (pluggable, any object with torque(cmd, omega)):
+          - MotorParams: friction-drive rollers (linear in command)
+          - DCMotorGearbox:
+                · Armature resistance
+                · Back-EMF
+                · Current saturation
+                · Torque saturation
+                · Gear reduction + efficiency
+
+The simulator integrates state using semi-implicit Euler, with the
+viscous damping term split off and applied in closed form (Lie–Trotter):
+    omega ← omega * exp(-b/I * dt) + (tau_m - tau_g + tau_ext)/I * dt
     theta ← theta + omega * dt
 
+The exact decay keeps the step stable for any damping coefficient b.
+
 It accepts an arbitrary controller callback:
     controller(theta, omega, time) → command in [-1, +1]
 
+A PDController instance is evaluated inline in the step rather than called.
+
 This allows:
     • PD controllers
     • Sugeno fuzzy controllers
@@ -34,6 +41,11 @@ This allows:
 Logging:
     The simulator records time, angle, angular velocity, motor torque,
     gravity torque, and motor command at a decimated rate (steps_per_log).
+    run() integrates in blocks of steps_per_log steps and logs once per block.
+    Logs are kept in one float64 array (a row per channel) and exposed as
+    NumPy views through sim.log_t, sim.log_theta, etc.
+    PD and open-loop runs on the built-in motor models use the Numba kernels
+    in simulation.kernels when Numba is installed.
 
 Typical usage::
 
@@ -56,24 +68,66 @@ UPDATED:
 """
 
 from dataclasses import dataclass, field
-from typing import Callable, Optional, List
+from typing import Callable, Optional, Union
 import math
+import numpy as np
 from simulation.perturbations import Perturbation   # <--- NEW
+from simulation import kernels
 
 
 # ------------------------------------------------------------
 # Dataclasses
 # ------------------------------------------------------------
+# Parameter records are frozen and slotted: they are never mutated after
+# construction, and slot reads are cheaper than __dict__ lookups in the step.
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MotorParams:
+    """Friction-drive rollers: torque is linear in the command."""
     tau_motor_one: float
     n_rollers: int
     r_roller: float
     r_wheel: float
 
+    @property
+    def gain(self) -> float:
+        """Wheel torque per unit command: tau_one * n / r_roller * r_wheel."""
+        return self.tau_motor_one * self.n_rollers / self.r_roller * self.r_wheel
 
-@dataclass
+    def torque(self, cmd: float, omega: float) -> float:
+        return cmd * self.gain
+
+
+@dataclass(slots=True, frozen=True)
+class DCMotorGearbox:
+    """
+    DC motor + gearbox: armature resistance, back-EMF, current and torque
+    saturation, gear reduction and efficiency.
+
+    `gear` is motor-shaft radians per carriage radian; `tau_max` limits the
+    motor-shaft torque before the gearbox.
+    """
+    V_max: float
+    R: float
+    Kv: float
+    Kt: float
+    gear: float
+    eta: float = 1.0
+    I_max: float = math.inf
+    tau_max: float = math.inf
+    n_motors: int = 1
+
+    def torque(self, cmd: float, omega: float) -> float:
+        current = (cmd * self.V_max - self.Kv * self.gear * omega) / self.R
+        current = max(-self.I_max, min(self.I_max, current))
+        tau_shaft = max(-self.tau_max, min(self.tau_max, self.Kt * current))
+        return tau_shaft * self.gear * self.eta * self.n_motors
+
+
+MotorModel = Union[MotorParams, DCMotorGearbox]
+
+
+@dataclass(slots=True, frozen=True)
 class PlantParams:
     I: float
     m: float
@@ -82,53 +136,123 @@ class PlantParams:
     g: float = 9.80665
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SimConfig:
     dt: float = 0.002
     steps_per_log: int = 10
+    perturb: Optional[Perturbation] = field(default=None, compare=False)
+    # Sweep mode: log=False records nothing; the final state is still
+    # available via CarriageSimulator.last_sample().
+    log: bool = True
+
+
+@dataclass(slots=True, frozen=True)
+class PDController:
+    """
+    Linear PD law  u = Kp*theta + Kd*omega, clamped to [-1, +1].
+
+    Callable like any other controller, but CarriageSimulator recognizes it
+    and evaluates the law inline instead of making a Python call per step.
+    """
+    Kp: float
+    Kd: float
+
+    def __call__(self, theta: float, omega: float, t: float) -> float:
+        u = self.Kp * theta + self.Kd * omega
+        return u if -1.0 <= u <= 1.0 else (1.0 if u > 0.0 else -1.0)
 
 
 # ------------------------------------------------------------
 # Simulator
 # ------------------------------------------------------------
 
+# Rows of CarriageSimulator._log, in order
+LOG_CHANNELS = ("t", "theta", "omega", "tau_m", "tau_g", "tau_ext", "cmd")
+
 @dataclass
 class CarriageSimulator:
     plant: PlantParams
-    motor: MotorParams
+    motor: MotorModel
     cfg: SimConfig = field(default_factory=SimConfig)
     controller: Optional[Callable[[float, float, float], float]] = None
 
+    # Controller dispatch: "callback" calls `controller`; "pd" evaluates
+    # Kp*theta + Kd*omega inline. Derived from `controller` (PDController
+    # -> "pd") and refreshed whenever `controller` is reassigned.
+    ctrl_kind: str = field(default="callback", init=False)
+    ctrl_Kp: float = field(default=0.0, init=False)
+    ctrl_Kd: float = field(default=0.0, init=False)
+    _ctrl_src: Optional[Callable] = field(default=None, init=False, repr=False)
+
     theta: float = 0.0
     omega: float = 0.0
     t: float = 0.0
 
-    log_t: List[float] = field(default_factory=list)
-    log_theta: List[float] = field(default_factory=list)
-    log_omega: List[float] = field(default_factory=list)
-    log_tau_m: List[float] = field(default_factory=list)
-    log_tau_g: List[float] = field(default_factory=list)
-    log_tau_ext: List[float] = field(default_factory=list)   # <--- NEW
-    log_cmd: List[float] = field(default_factory=list)
-    _log_decim: int = 0
+    # Time is derived from an integer step count (t = _t0 + _k*dt), so it
+    # never accumulates rounding drift and event times are hit exactly.
+    _t0: float = field(default=0.0, init=False, repr=False)
+    _k: int = field(default=0, init=False, repr=False)
+
+    # Log: one float64 row per channel (LOG_CHANNELS), _n columns filled.
+    # Capacity doubles as needed; read it through the log_* properties.
+    _log: np.ndarray = field(default_factory=lambda: np.empty((len(LOG_CHANNELS), 0)),
+                             init=False, repr=False)
+    _n: int = field(default=0, init=False, repr=False)
+    _last_sample: Optional[tuple] = field(default=None, init=False, repr=False)
+
+    # Steps since step() last logged (run() logs per block and ignores it)
+    _log_decim: int = field(default=0, init=False, repr=False)
+
+    # ------------------------------------------------------------
+    def __post_init__(self):
+        self._sync_controller()
+        self._prepare_constants()
+
+    # ------------------------------------------------------------
+    def _sync_controller(self):
+        """Re-derive the controller dispatch if `controller` was reassigned."""
+        ctrl = self.controller
+        if ctrl is self._ctrl_src:
+            return
+        self._ctrl_src = ctrl
+        if isinstance(ctrl, PDController):
+            self.ctrl_kind, self.ctrl_Kp, self.ctrl_Kd = "pd", ctrl.Kp, ctrl.Kd
+        else:
+            self.ctrl_kind, self.ctrl_Kp, self.ctrl_Kd = "callback", 0.0, 0.0
+
+    # ------------------------------------------------------------
+    def _prepare_constants(self):
+        """Fold the fixed plant/motor parameters into per-step constants."""
+        self._mgr = self.plant.m * self.plant.g * self.plant.r
+        self._inv_I = 1.0 / self.plant.I
+
+        # Linear motors reduce to one gain; others are asked for torque(cmd, omega)
+        self._motor_gain = self.motor.gain if isinstance(self.motor, MotorParams) else None
+
+        # Viscous damping I*dω/dt = -b*ω is applied in closed form each step
+        self._damp_decay = math.exp(-self.plant.b * self._inv_I * self.cfg.dt)
+        self._dt_over_I = self.cfg.dt * self._inv_I
 
     # ------------------------------------------------------------
     def reset(self, theta=0.0, omega=0.0, t=0.0):
         self.theta = theta
         self.omega = omega
         self.t = t
-
-        self.log_t.clear()
-        self.log_theta.clear()
-        self.log_omega.clear()
-        self.log_tau_m.clear()
-        self.log_tau_g.clear()
-        self.log_tau_ext.clear()   # <--- NEW
-        self.log_cmd.clear()
+        self._t0 = t
+        self._k = 0
+        self._sync_controller()
+        self._prepare_constants()
+
+        # Fresh buffer rather than rewinding, so log views taken from an
+        # earlier run keep their data
+        self._log = np.empty((len(LOG_CHANNELS), 0))
+        self._n = 0
+        self._last_sample = None
         self._log_decim = 0
 
         # Install perturbation driver
         self.perturb = Perturbation()
+        self.perturb.set_timestep(self.cfg.dt)
 
         # Default test conditions:
         # 1. Impulse at t = 5
@@ -144,54 +268,202 @@ class CarriageSimulator:
 
     # ------------------------------------------------------------
     def _gravity_torque(self):
-        return self.plant.m * self.plant.g * self.plant.r * math.sin(self.theta)
+        return self._mgr * math.sin(self.theta)
 
     # ------------------------------------------------------------
     def _motor_torque(self, motor_cmd: float):
-        """Convert motor command [-1..1] into torque via friction-drive rollers."""
-        tau_one = self.motor.tau_motor_one
-        n = self.motor.n_rollers
-        r_roller = self.motor.r_roller
-        r_wheel = self.motor.r_wheel
-
-        tau_rollers = motor_cmd * tau_one * n
-        F_tangent = tau_rollers / r_roller
-        return F_tangent * r_wheel
+        """Convert motor command [-1..1] into wheel torque via the motor model."""
+        return self.motor.torque(motor_cmd, self.omega)
 
     # ------------------------------------------------------------
-    def step(self):
+    def _advance_one(self, tau_ext: float):
+        """Integrate one dt without logging; returns (cmd, tau_m, tau_g, tau_ext)."""
         # Controller
-        cmd = self.controller(self.theta, self.omega, self.t) if self.controller else 0.0
-        cmd = max(-1.0, min(1.0, cmd))
+        if self.ctrl_kind == "pd":
+            cmd = self.ctrl_Kp * self.theta + self.ctrl_Kd * self.omega
+        elif self.controller:
+            cmd = self.controller(self.theta, self.omega, self.t)
+        else:
+            cmd = 0.0
+        if not -1.0 <= cmd <= 1.0:
+            cmd = 1.0 if cmd > 0.0 else -1.0
 
         # Motor & plant torques
-        tau_m = self._motor_torque(cmd)
-        tau_g = self._gravity_torque()
-        tau_d = -self.plant.b * self.omega
+        gain = self._motor_gain
+        tau_m = cmd * gain if gain is not None else self.motor.torque(cmd, self.omega)
+        tau_g = self._mgr * math.sin(self.theta)
 
-        # NEW: perturbation torque
-        tau_ext = self.perturb.get(self.t)
-
-        # Dynamics
-        alpha = (tau_m - tau_g + tau_d + tau_ext) / self.plant.I
-        self.omega += alpha * self.cfg.dt
+        # Dynamics: exact damping decay, then the remaining torques
+        self.omega = self.omega * self._damp_decay + (tau_m - tau_g + tau_ext) * self._dt_over_I
         self.theta += self.omega * self.cfg.dt
-        self.t     += self.cfg.dt
+        self._k += 1
+        self.t = self._t0 + self._k * self.cfg.dt
+
+        return cmd, tau_m, tau_g, tau_ext
+
+    # ------------------------------------------------------------
+    def _reserve_log(self, extra: int):
+        """Make room for `extra` more log columns, at least doubling capacity."""
+        need = self._n + extra
+        capacity = self._log.shape[1]
+        if need > capacity:
+            grown = np.empty((len(LOG_CHANNELS), max(need, 2 * capacity, 256)))
+            grown[:, :self._n] = self._log[:, :self._n]
+            self._log = grown
+
+    # ------------------------------------------------------------
+    def _log_sample(self, cmd, tau_m, tau_g, tau_ext):
+        if self._n == self._log.shape[1]:
+            self._reserve_log(1)
+        self._log[:, self._n] = (self.t, self.theta, self.omega, tau_m, tau_g, tau_ext, cmd)
+        self._n += 1
+
+    # ------------------------------------------------------------
+    # Logged channels as float64 views of the filled part of the buffer.
+    # A view keeps the data it saw; take a new one after further runs.
+    @property
+    def log_t(self) -> np.ndarray:
+        return self._log[0, :self._n]
+
+    @property
+    def log_theta(self) -> np.ndarray:
+        return self._log[1, :self._n]
+
+    @property
+    def log_omega(self) -> np.ndarray:
+        return self._log[2, :self._n]
 
-        # Logging (decimated)
-        self._log_decim += 1
-        if self._log_decim >= self.cfg.steps_per_log:
-            self.log_t.append(self.t)
-            self.log_theta.append(self.theta)
-            self.log_omega.append(self.omega)
-            self.log_tau_m.append(tau_m)
-            self.log_tau_g.append(tau_g)
-            self.log_tau_ext.append(tau_ext)   # <--- NEW
-            self.log_cmd.append(cmd)
-            self._log_decim = 0
+    @property
+    def log_tau_m(self) -> np.ndarray:
+        return self._log[3, :self._n]
+
+    @property
+    def log_tau_g(self) -> np.ndarray:
+        return self._log[4, :self._n]
+
+    @property
+    def log_tau_ext(self) -> np.ndarray:
+        return self._log[5, :self._n]
+
+    @property
+    def log_cmd(self) -> np.ndarray:
+        return self._log[6, :self._n]
+
+    # ------------------------------------------------------------
+    def step(self):
+        """Advance one timestep, recording it every steps_per_log steps."""
+        self._sync_controller()
+        sample = self._advance_one(self.perturb.get(self.t))
+        if self.cfg.log:
+            self._log_decim += 1
+            if self._log_decim >= self.cfg.steps_per_log:
+                self._log_sample(*sample)
+                self._log_decim = 0
+        self._set_last_sample(sample)
+
+    # ------------------------------------------------------------
+    def _set_last_sample(self, sample):
+        cmd, tau_m, tau_g, tau_ext = sample
+        self._last_sample = (self.t, self.theta, self.omega, tau_m, tau_g, tau_ext, cmd)
+
+    # ------------------------------------------------------------
+    def last_sample(self):
+        """Final (t, theta, omega, tau_m, tau_g, tau_ext, cmd), or None before any step."""
+        return self._last_sample
 
     # ------------------------------------------------------------
     def run(self, seconds):
-        steps = int(seconds / self.cfg.dt)
-        for _ in range(steps):
-            self.step()
+        """
+        Integrate for `seconds`, logging once every `steps_per_log` steps.
+
+        The inner loop only integrates; the log is written once per block,
+        so the hot path carries no decimation counter or branch. The external
+        torque for the whole run is evaluated up front in one vectorized pass.
+        With cfg.log=False the log is skipped entirely.
+
+        PD and open-loop runs on either built-in motor model go through the
+        compiled kernels when Numba is available; callback controllers and
+        custom motor models stay in Python.
+        """
+        dt = self.cfg.dt
+        steps = round(seconds / dt)
+        if steps <= 0:
+            return
+        self._sync_controller()
+
+        ts = self._t0 + (self._k + np.arange(steps)) * dt
+        tau_ext = self.perturb.sample(ts)
+
+        if kernels.HAVE_NUMBA and self._kernel_supported():
+            self._run_kernel(tau_ext)
+            return
+
+        tau_ext = tau_ext.tolist()
+
+        if not self.cfg.log:
+            for k in range(steps):
+                sample = self._advance_one(tau_ext[k])
+            self._set_last_sample(sample)
+            return
+
+        steps_per_log = max(1, self.cfg.steps_per_log)
+        n_log, remainder = divmod(steps, steps_per_log)
+        self._reserve_log(n_log)   # sized for the whole run: no growth in the loop
+        k = 0
+
+        for _ in range(n_log):
+            for _ in range(steps_per_log):
+                sample = self._advance_one(tau_ext[k])
+                k += 1
+            self._log_sample(*sample)
+
+        # Trailing steps that do not complete a log block are integrated only
+        for _ in range(remainder):
+            sample = self._advance_one(tau_ext[k])
+            k += 1
+
+        self._set_last_sample(sample)
+
+    # ------------------------------------------------------------
+    def _kernel_supported(self) -> bool:
+        open_loop = self.ctrl_kind != "pd" and self.controller is None
+        known_motor = self._motor_gain is not None or isinstance(self.motor, DCMotorGearbox)
+        return known_motor and (self.ctrl_kind == "pd" or open_loop)
+
+    # ------------------------------------------------------------
+    def _run_kernel(self, tau_ext: np.ndarray):
+        """run() body for the compiled PD / open-loop kernel."""
+        dt = self.cfg.dt
+        Kp, Kd = (self.ctrl_Kp, self.ctrl_Kd) if self.ctrl_kind == "pd" else (0.0, 0.0)
+        if self._motor_gain is not None:
+            theta, omega, cmd, tau_m, tau_g = kernels.integrate_pd(
+                self.theta, self.omega, dt, tau_ext, Kp, Kd,
+                self._mgr, self._motor_gain, self._damp_decay, self._dt_over_I,
+            )
+        else:
+            m = self.motor
+            theta, omega, cmd, tau_m, tau_g = kernels.integrate_pd_dc(
+                self.theta, self.omega, dt, tau_ext, Kp, Kd,
+                self._mgr, self._damp_decay, self._dt_over_I,
+                m.V_max, m.R, m.Kv, m.Kt, m.gear, m.eta, m.I_max, m.tau_max, m.n_motors,
+            )
+
+        steps = len(tau_ext)
+        k0 = self._k
+        self.theta = float(theta[-1])
+        self.omega = float(omega[-1])
+        self._k = k0 + steps
+        self.t = self._t0 + self._k * dt
+
+        if self.cfg.log:
+            # Same decimation as the Python path: the last step of each full block
+            steps_per_log = max(1, self.cfg.steps_per_log)
+            idx = np.arange(steps_per_log - 1, steps, steps_per_log)
+            self._reserve_log(idx.size)
+            cols = slice(self._n, self._n + idx.size)
+            self._log[0, cols] = self._t0 + (k0 + idx + 1) * dt
+            for row, series in enumerate((theta, omega, tau_m, tau_g, tau_ext, cmd), start=1):
+                self._log[row, cols] = series[idx]
+            self._n += idx.size
+
+        self._set_last_sample((float(cmd[-1]), float(tau_m[-1]), float(tau_g[-1]), float(tau_ext[-1])))
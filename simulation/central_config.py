@@ -19,7 +19,8 @@ Responsibilities
 
 • Construct the following dataclasses:
       - PlantParams     (mechanical inertia model)
-      - MotorParams     (DC motor + gearbox model)
+      - MotorParams     (friction-drive roller model), or
+        DCMotorGearbox  (DC motor + gearbox, when [motor] has Kt/Kv/R keys)
       - SimConfig       (numerical integration and logging settings)
 
 • Read initial conditions:
@@ -28,7 +29,7 @@ Responsibilities
 • Provide simulation duration (seconds)
 
 • Select and build the controller:
-      - PD controller      (Kp, Kd from sim_config.toml)
+      - PD controller      (Kp, Kd from sim_config.toml; PDController)
       - Sugeno FLC         (loaded from flc_config.toml)
       - NONE               (open-loop, motor torque = 0)
 
@@ -42,7 +43,7 @@ Returned Values
 load_simulation_config() returns a 6-tuple:
 
     plant       : PlantParams
-    motor       : MotorParams
+    motor       : MotorParams | DCMotorGearbox
     sim_cfg     : SimConfig
     duration    : float
     controller  : Callable[[theta, omega, t], motor_cmd]
@@ -53,11 +54,24 @@ Architecture Notes
 • No part of this module depends on plotting, hardware drivers, or
   the simulator itself. This keeps configuration logic isolated.
 
-• FLCController is imported only for building fuzzy controllers.
+• FLCController is imported only for building fuzzy controllers, and
+  lazily, so PD and open-loop runs never load the flc package.
   Raw TOML data is converted into the controller's internal format via
   FLCController(flc_cfg).
 
-• TOML parsing is done via Python's built-in `tomllib` module.
+• TOML parsing is done via Python's built-in `tomllib` module. Parsed
+  files are memoized on (path, mtime) so repeated loads in sweeps are free.
+  With each file parsed at most once per process, a native TOML parser
+  would only shave a one-off startup cost, so no extra dependency is used.
+
+• For fixed deployments, scripts/gen_baked_config.py bakes the TOML files
+  into simulation/_baked_config.py; with USE_BAKED_CONFIG=1 the loader
+  builds from those constants and never invokes tomllib.
+
+• With CONFIG_PICKLE_CACHE=1, each parsed TOML file is also pickled next
+  to its source (<name>.toml.cache.pkl) behind a hash of the file's bytes.
+  Fresh processes (spawned Monte-Carlo workers, repeated script runs) then
+  unpickle instead of parsing; any edit changes the hash and re-parses.
 
 Typical Usage
 -------------
@@ -75,98 +89,132 @@ Typical Usage
 This loader allows high-level scripts (main.py, test harnesses,
 batch sweep tools) to construct simulations cleanly and uniformly.
 """
+import copy
+import dataclasses
+import functools
+import hashlib
+import logging
+import os
+import pickle
 import tomllib
-from typing import Callable, Optional
+from typing import TYPE_CHECKING, Callable, Optional
 
-from simulation.carriage_simulator import PlantParams, MotorParams, SimConfig
+from simulation.carriage_simulator import (
+    PlantParams, MotorParams, DCMotorGearbox, SimConfig, PDController,
+)
 from simulation.perturbations import Perturbation
-from flc.controller import FLCController
+
+if TYPE_CHECKING:
+    from flc.controller import FLCController
+
+config_log = logging.getLogger("simulation.config")
+
+# Relative paths inside the config files (FLC_CONFIG_PATH) are taken from the
+# repo root, whatever the working directory; scripts/gen_baked_config.py and
+# run_simulation resolve them the same way
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _resolve_repo_path(path: str) -> str:
+    return path if os.path.isabs(path) else os.path.join(_REPO_ROOT, path)
 
 
 # ------------------------------------------------------------
-# Load TOML
+# Load TOML (memoized on resolved path + mtime)
 # ------------------------------------------------------------
-def _load_toml(path: str) -> dict:
+@functools.lru_cache(maxsize=32)
+def _load_toml_cached(path: str, mtime: float) -> dict:
+    if os.environ.get("CONFIG_PICKLE_CACHE", "").lower() in ("1", "true", "yes"):
+        return _load_toml_pickled(path)
     with open(path, "rb") as f:
         return tomllib.load(f)
 
 
-# ------------------------------------------------------------
-# Load FLC controller
-# ------------------------------------------------------------
-def load_flc_from_file(path: str) -> FLCController:
-    flc_cfg = _load_toml(path)
-    return FLCController(flc_cfg)
+def _load_toml_pickled(path: str) -> dict:
+    """
+    Parse `path` through the on-disk pickle cache (see CONFIG_PICKLE_CACHE).
+
+    The cache file is a 16-character blake2b hex digest of the TOML bytes
+    followed by the pickled dict; a mismatching or unreadable cache is
+    simply rebuilt.
+    """
+    with open(path, "rb") as f:
+        data = f.read()
+    digest = hashlib.blake2b(data, digest_size=8).hexdigest().encode("ascii")
+    cache_path = path + ".cache.pkl"
+
+    try:
+        with open(cache_path, "rb") as f:
+            if f.read(len(digest)) == digest:
+                return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    cfg = tomllib.loads(data.decode("utf-8"))
+    try:
+        with open(cache_path, "wb") as f:
+            f.write(digest)
+            pickle.dump(cfg, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError as e:
+        config_log.debug("Could not write TOML cache %s (%s)", cache_path, e)
+    return cfg
+
+
+def load_toml(path: str) -> dict:
+    """
+    Parse a TOML file, reusing the previous parse while the file is unchanged.
+
+    Batch sweeps build many simulators from the same config files; the cache
+    key includes the file's mtime so edits on disk are still picked up.
+    Callers get a deep copy, so mutating the result cannot poison the cache.
+    """
+    path = os.path.realpath(path)
+    return copy.deepcopy(_load_toml_cached(path, os.path.getmtime(path)))
 
 
 # ------------------------------------------------------------
-# Main loader
+# Baked configuration (scripts/gen_baked_config.py)
 # ------------------------------------------------------------
-def load_simulation_config(
-    sim_cfg_path: str = "config/sim_config.toml",
-):
+def _baked_config(sim_cfg_path: str) -> Optional[tuple]:
     """
-    Builds and returns the full simulation configuration:
-
-        plant       : PlantParams
-        motor       : MotorParams
-        sim_cfg     : SimConfig
-        duration    : float
-        controller  : Callable[theta,omega,t] → cmd
-        ic_tuple    : (theta0, omega0, t0)
+    (sim_cfg, flc_cfg) from simulation/_baked_config.py when USE_BAKED_CONFIG
+    is set and the module was generated from `sim_cfg_path`, else None.
     """
-    cfg = _load_toml(sim_cfg_path)
+    if os.environ.get("USE_BAKED_CONFIG", "").lower() not in ("1", "true", "yes"):
+        return None
+    try:
+        from simulation import _baked_config as baked
+    except ImportError as e:
+        raise RuntimeError(
+            "USE_BAKED_CONFIG is set but simulation/_baked_config.py is missing; "
+            "run scripts/gen_baked_config.py"
+        ) from e
+    if os.path.realpath(sim_cfg_path) != baked.SOURCE_PATH:
+        return None
+    return copy.deepcopy(baked.SIM_CONFIG), copy.deepcopy(baked.FLC_CONFIG)
 
-    # ------------------------------------------------------------
-    # Mechanical plant
-    # ------------------------------------------------------------
-    plant = PlantParams(
-        I=float(cfg["plant"]["I"]),
-        m=float(cfg["plant"]["m"]),
-        r=float(cfg["plant"]["r"]),
-        b=float(cfg["plant"].get("b", 0.0)),
-        g=float(cfg["plant"].get("g", 9.80665)),
-    )
 
-    # ------------------------------------------------------------
-    # Motor parameters
-    # ------------------------------------------------------------
-    motor = MotorParams(
-        tau_motor_one=float(cfg["motor"]["tau_motor_one"]),
-        n_rollers=int(cfg["motor"]["n_rollers"]),
-        r_roller=float(cfg["motor"]["r_roller"]),
-        r_wheel=float(cfg["motor"]["r_wheel"]),
-    )
-
-    # ------------------------------------------------------------
-    # Simulation configuration
-    # ------------------------------------------------------------
-    sim_cfg = SimConfig(
-        dt=float(cfg["simulation"]["dt"]),
-        steps_per_log=int(cfg["simulation"]["steps_per_log"]),
-    )
+# ------------------------------------------------------------
+# Load FLC controller
+# ------------------------------------------------------------
+def load_flc_from_file(path: str) -> "FLCController":
+    from flc.controller import FLCController
 
-    duration = float(cfg["simulation"]["DURATION_S"])
+    flc_cfg = load_toml(path)
+    return FLCController(flc_cfg)
 
-    # ------------------------------------------------------------
-    # Initial conditions
-    # ------------------------------------------------------------
-    icfg = cfg["initial_conditions"]
-    ic_tuple = (
-        float(icfg["THETA_INITIAL_RAD"]),
-        float(icfg["OMEGA_INITIAL_RAD_S"]),
-        float(icfg.get("START_TIME_S", 0.0)),
-    )
 
-    # ------------------------------------------------------------
-    # Disturbance configuration
-    # ------------------------------------------------------------
-    sim_cfg.perturb = Perturbation()
+# ------------------------------------------------------------
+# Disturbances
+# ------------------------------------------------------------
+def _build_perturbation(cfg: dict) -> Perturbation:
+    """Disturbance sources from the parsed sim config."""
+    perturb = Perturbation()
 
     # --- Impulses ---
     if "impulse" in cfg and cfg["impulse"].get("enable", False):
         for ev in cfg["impulse"].get("events", []):
-            sim_cfg.perturb.add_impulse(
+            perturb.add_impulse(
                 float(ev["t0"]),
                 float(ev["magnitude"]),
             )
@@ -174,7 +222,7 @@ def load_simulation_config(
     # --- Step disturbances ---
     if "step" in cfg and cfg["step"].get("enable", False):
         for ev in cfg["step"].get("events", []):
-            sim_cfg.perturb.add_step(
+            perturb.add_step(
                 float(ev["t0"]),
                 float(ev["t1"]),
                 float(ev["magnitude"]),
@@ -183,7 +231,7 @@ def load_simulation_config(
     # --- Deterministic sine wave ---
     if "sine" in cfg and cfg["sine"].get("enable", False):
         s = cfg["sine"]
-        sim_cfg.perturb.add_sine(
+        perturb.add_sine(
             amplitude=float(s["amplitude"]),
             freq=float(s["frequency"]),
             phase=float(s.get("phase", 0.0)),
@@ -194,7 +242,7 @@ def load_simulation_config(
     # --- Random-phase sine wave ---
     if "rnd_sine" in cfg and cfg["rnd_sine"].get("enable", False):
         r = cfg["rnd_sine"]
-        sim_cfg.perturb.add_random_phase_sine(
+        perturb.add_random_phase_sine(
             amplitude=float(r["amplitude"]),
             freq=float(r["frequency"]),
             t_start=float(s.get("t_start", 0.0)),
@@ -204,7 +252,7 @@ def load_simulation_config(
     # --- Multiple sine harmonics ---
     if "multi_sine" in cfg:
         for ev in cfg["multi_sine"]:
-            sim_cfg.perturb.add_sine(
+            perturb.add_sine(
                 amplitude=float(ev["amplitude"]),
                 freq=float(ev["frequency"]),
                 phase=float(ev.get("phase", 0.0)),
@@ -213,10 +261,125 @@ def load_simulation_config(
             )
 
     if "noise" in cfg and cfg["noise"].get("enable", False):
-        sim_cfg.perturb.add_noise(
+        perturb.add_noise(
             float(cfg["noise"]["std"])
         )
 
+    return perturb
+
+
+# ------------------------------------------------------------
+# Main loader
+# ------------------------------------------------------------
+_CONFIG_CACHE: dict = {}
+_CONFIG_CACHE_SIZE = 8
+
+
+def load_simulation_config(
+    sim_cfg_path: str = "config/sim_config.toml",
+):
+    """
+    Builds and returns the full simulation configuration:
+
+        plant       : PlantParams
+        motor       : MotorParams | DCMotorGearbox
+        sim_cfg     : SimConfig
+        duration    : float
+        controller  : Callable[theta,omega,t] → cmd
+        ic_tuple    : (theta0, omega0, t0)
+
+    The parsed config and the immutable parts (plant, motor, SimConfig
+    settings, duration, controller, initial conditions) are memoized per
+    config path until any file they were built from changes on disk. The
+    Perturbation is rebuilt from the parsed config on every call, so each
+    caller gets its own and random-phase sines draw fresh phases.
+    """
+    key = (os.path.realpath(sim_cfg_path), os.environ.get("USE_BAKED_CONFIG", ""))
+    hit = _CONFIG_CACHE.get(key)
+    if hit is None or any(os.path.getmtime(p) != m for p, m in hit[0]):
+        deps: list = []
+        cfg, parts = _build_simulation_config(sim_cfg_path, deps)
+        if key not in _CONFIG_CACHE and len(_CONFIG_CACHE) >= _CONFIG_CACHE_SIZE:
+            _CONFIG_CACHE.pop(next(iter(_CONFIG_CACHE)))
+        hit = (tuple((p, os.path.getmtime(p)) for p in deps), cfg, parts)
+        _CONFIG_CACHE[key] = hit
+
+    _, cfg, (plant, motor, sim_cfg, duration, controller, ic_tuple) = hit
+    sim_cfg = dataclasses.replace(sim_cfg, perturb=_build_perturbation(cfg))
+    return plant, motor, sim_cfg, duration, controller, ic_tuple
+
+
+def _build_simulation_config(sim_cfg_path: str, deps: list):
+    """
+    load_simulation_config() body: returns (parsed cfg, result tuple) with
+    the SimConfig's perturb left unset, and appends every file read to `deps`.
+    """
+    baked = _baked_config(sim_cfg_path)
+    if baked is not None:
+        cfg = baked[0]
+    else:
+        cfg = load_toml(sim_cfg_path)
+        deps.append(os.path.realpath(sim_cfg_path))
+
+    # ------------------------------------------------------------
+    # Mechanical plant
+    # ------------------------------------------------------------
+    plant = PlantParams(
+        I=float(cfg["plant"]["I"]),
+        m=float(cfg["plant"]["m"]),
+        r=float(cfg["plant"]["r"]),
+        b=float(cfg["plant"].get("b", 0.0)),
+        g=float(cfg["plant"].get("g", 9.80665)),
+    )
+
+    # ------------------------------------------------------------
+    # Motor model (DC motor + gearbox if its electrical keys are present,
+    # otherwise the friction-drive roller model)
+    # ------------------------------------------------------------
+    mcfg = cfg["motor"]
+    if "Kt" in mcfg:
+        motor = DCMotorGearbox(
+            V_max=float(mcfg["V_max"]),
+            R=float(mcfg["R"]),
+            Kv=float(mcfg["Kv"]),
+            Kt=float(mcfg["Kt"]),
+            gear=float(mcfg["gear"]),
+            eta=float(mcfg.get("eta", 1.0)),
+            I_max=float(mcfg.get("I_max", float("inf"))),
+            tau_max=float(mcfg.get("tau_max", float("inf"))),
+            n_motors=int(mcfg.get("n_motors", 1)),
+        )
+    else:
+        motor = MotorParams(
+            tau_motor_one=float(mcfg["tau_motor_one"]),
+            n_rollers=int(mcfg["n_rollers"]),
+            r_roller=float(mcfg["r_roller"]),
+            r_wheel=float(mcfg["r_wheel"]),
+        )
+
+    # ------------------------------------------------------------
+    # Simulation duration
+    # ------------------------------------------------------------
+    duration = float(cfg["simulation"]["DURATION_S"])
+
+    # ------------------------------------------------------------
+    # Initial conditions
+    # ------------------------------------------------------------
+    icfg = cfg["initial_conditions"]
+    ic_tuple = (
+        float(icfg["THETA_INITIAL_RAD"]),
+        float(icfg["OMEGA_INITIAL_RAD_S"]),
+        float(icfg.get("START_TIME_S", 0.0)),
+    )
+
+    # ------------------------------------------------------------
+    # Simulation configuration (disturbances are attached per call)
+    # ------------------------------------------------------------
+    sim_cfg = SimConfig(
+        dt=float(cfg["simulation"]["dt"]),
+        steps_per_log=int(cfg["simulation"]["steps_per_log"]),
+    )
+
     # ------------------------------------------------------------
     # Controller selection
     # ------------------------------------------------------------
@@ -226,23 +389,27 @@ def load_simulation_config(
     controller: Optional[Callable] = None
 
     if ctrl_type == "PD":
-        Kp = float(ctrl_cfg["Kp"])
-        Kd = float(ctrl_cfg["Kd"])
-
-        def pd_controller(theta, omega, t):
-            u = Kp * theta + Kd * omega
-            return max(-1.0, min(1.0, u))
-
-        controller = pd_controller
+        # Recognized by CarriageSimulator and evaluated inline per step
+        controller = PDController(
+            Kp=float(ctrl_cfg["Kp"]),
+            Kd=float(ctrl_cfg["Kd"]),
+        )
 
     elif ctrl_type == "FLC":
-        print(">>> Controller type = FLC")
-        flc_path = ctrl_cfg["FLC_CONFIG_PATH"]
-        print(">>> Loading FLC config from:", flc_path)
-
-        flc_cfg = _load_toml(flc_path)
-        print(">>> Loaded keys:", flc_cfg.keys())
-
+        config_log.debug("Controller type = FLC")
+        flc_path = _resolve_repo_path(ctrl_cfg["FLC_CONFIG_PATH"])
+        config_log.debug("Loading FLC config from: %s", flc_path)
+
+        if baked is not None and baked[1] is not None:
+            flc_cfg = baked[1]
+        elif os.path.realpath(flc_path) == os.path.realpath(sim_cfg_path):
+            flc_cfg = cfg
+        else:
+            flc_cfg = load_toml(flc_path)
+            deps.append(os.path.realpath(flc_path))
+        config_log.debug("Loaded FLC keys: %s", list(flc_cfg))
+
+        from flc.controller import FLCController   # only FLC runs pay for the import
         flc = FLCController(flc_cfg)
 
         # Input scaling
@@ -250,10 +417,19 @@ def load_simulation_config(
         theta_max = float(scale_cfg.get("THETA_MAX_RAD", 1.0))
         omega_max = float(scale_cfg.get("OMEGA_MAX_RAD_S", 1.0))
 
-        def flc_controller(theta, omega, t):
-            theta_n = max(-1.0, min(1.0, theta / theta_max))
-            omega_n = max(-1.0, min(1.0, omega / omega_max))
-            return flc.calculate_motor_cmd(theta_n, omega_n)
+        # Scales and the bound FLC method are bound as defaults so the
+        # per-step call reads locals, and the divisions become multiplies
+        def flc_controller(theta, omega, t,
+                           inv_theta_max=1.0 / theta_max,
+                           inv_omega_max=1.0 / omega_max,
+                           calculate=flc.calculate_motor_cmd):
+            theta_n = theta * inv_theta_max
+            if not -1.0 <= theta_n <= 1.0:
+                theta_n = 1.0 if theta_n > 0.0 else -1.0
+            omega_n = omega * inv_omega_max
+            if not -1.0 <= omega_n <= 1.0:
+                omega_n = 1.0 if omega_n > 0.0 else -1.0
+            return calculate(theta_n, omega_n)
 
         controller = flc_controller
 
@@ -263,4 +439,4 @@ def load_simulation_config(
     else:
         raise ValueError(f"Unknown controller type: {ctrl_type}")
 
-    return plant, motor, sim_cfg, duration, controller, ic_tuple
+    return cfg, (plant, motor, sim_cfg, duration, controller, ic_tuple)
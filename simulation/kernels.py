@@ -0,0 +1,135 @@
+"""
+kernels.py
+==========
+
+Array-in / array-out integration loops for CarriageSimulator.run().
+
+The kernels repeat the simulator step (semi-implicit Euler with the exact
+damping decay) over a precomputed τ_ext series, with the controller and
+motor folded into scalar arguments. They are compiled with Numba when it is
+installed; HAVE_NUMBA tells the simulator whether calling them is worth it.
+Without Numba the decorator is a no-op and the functions still run as plain
+Python, which keeps them testable everywhere.
+
+The kernels are compiled with strict IEEE semantics (no fastmath): its
+`ninf` flag would make the infinite defaults for sine windows and motor
+limits undefined, and without contraction or reassociation the compiled
+results match the Python step bit for bit.
+
+Numba is used rather than a Cython extension because the project has no
+build step: a .pyx module would need a setup.py/cythonize stage and a C
+toolchain on every machine (including the Pi), while Numba compiles the
+same loops on first call and caches them next to the source.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:  # Numba is optional
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda fn: fn
+
+
+@njit(cache=True, boundscheck=False)
+def integrate_pd(theta, omega, dt, tau_ext, Kp, Kd, mgr, motor_gain, damp_decay, dt_over_I):
+    """
+    Integrate len(tau_ext) steps under cmd = clamp(Kp*theta + Kd*omega).
+
+    Open loop is Kp = Kd = 0. The motor must be linear (tau_m = cmd * gain).
+    Returns per-step arrays (theta, omega, cmd, tau_m, tau_g) holding the
+    state after each step and the torques that produced it.
+    """
+    n = tau_ext.shape[0]
+    theta_out = np.empty(n)
+    omega_out = np.empty(n)
+    cmd_out = np.empty(n)
+    tau_m_out = np.empty(n)
+    tau_g_out = np.empty(n)
+
+    for k in range(n):
+        u = Kp * theta + Kd * omega
+        cmd = u if -1.0 <= u <= 1.0 else (1.0 if u > 0.0 else -1.0)
+        tau_m = cmd * motor_gain
+        tau_g = mgr * np.sin(theta)
+
+        omega = omega * damp_decay + (tau_m - tau_g + tau_ext[k]) * dt_over_I
+        theta += omega * dt
+
+        theta_out[k] = theta
+        omega_out[k] = omega
+        cmd_out[k] = cmd
+        tau_m_out[k] = tau_m
+        tau_g_out[k] = tau_g
+
+    return theta_out, omega_out, cmd_out, tau_m_out, tau_g_out
+
+
+@njit(cache=True, boundscheck=False)
+def source_series(ts, rows, out):
+    """
+    Add the deterministic perturbation sources at every time in `ts` to `out`.
+
+    `rows` is the tagged (code, p0..p4) table from _PerturbBuffers:
+    0 = impulse (t0, mag), 1 = step (t0, t1, mag),
+    2 = sine (amp, omega, phase, t0, t1). Open-ended windows carry
+    t1 = inf, so this kernel is compiled without fastmath (whose `ninf`
+    flag assumes no infinities).
+    """
+    for i in range(ts.shape[0]):
+        t = ts[i]
+        tau = 0.0
+        for r in range(rows.shape[0]):
+            code = rows[r, 0]
+            if code == 0.0:
+                if abs(t - rows[r, 1]) < 1e-6:
+                    tau += rows[r, 2]
+            elif code == 1.0:
+                if rows[r, 1] <= t <= rows[r, 2]:
+                    tau += rows[r, 3]
+            elif rows[r, 4] <= t <= rows[r, 5]:
+                tau += rows[r, 1] * np.sin(rows[r, 2] * t + rows[r, 3])
+        out[i] += tau
+
+
+@njit(cache=True, boundscheck=False)
+def integrate_pd_dc(theta, omega, dt, tau_ext, Kp, Kd, mgr, damp_decay, dt_over_I,
+                    V_max, R, Kv, Kt, gear, eta, I_max, tau_max, n_motors):
+    """
+    integrate_pd() for a DCMotorGearbox: the motor torque follows back-EMF,
+    current saturation and torque saturation exactly as DCMotorGearbox.torque().
+    I_max and tau_max default to inf, one reason these kernels are not
+    compiled with fastmath.
+    """
+    n = tau_ext.shape[0]
+    theta_out = np.empty(n)
+    omega_out = np.empty(n)
+    cmd_out = np.empty(n)
+    tau_m_out = np.empty(n)
+    tau_g_out = np.empty(n)
+
+    for k in range(n):
+        u = Kp * theta + Kd * omega
+        cmd = u if -1.0 <= u <= 1.0 else (1.0 if u > 0.0 else -1.0)
+
+        current = (cmd * V_max - Kv * gear * omega) / R
+        current = max(-I_max, min(I_max, current))
+        tau_shaft = max(-tau_max, min(tau_max, Kt * current))
+        tau_m = tau_shaft * gear * eta * n_motors
+        tau_g = mgr * np.sin(theta)
+
+        omega = omega * damp_decay + (tau_m - tau_g + tau_ext[k]) * dt_over_I
+        theta += omega * dt
+
+        theta_out[k] = theta
+        omega_out[k] = omega
+        cmd_out[k] = cmd
+        tau_m_out[k] = tau_m
+        tau_g_out[k] = tau_g
+
+    return theta_out, omega_out, cmd_out, tau_m_out, tau_g_out
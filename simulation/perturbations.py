@@ -14,16 +14,92 @@ into the carriage dynamics during simulation. This includes:
     • Random torque "kicks" with probability
 
 All disturbance components sum into a single external torque τ_ext
-returned by Perturbation.get(t).
+returned by Perturbation.get(t). Perturbation.sample(ts) evaluates the same
+sum over a whole time grid at once with NumPy, so a simulator can build its
+τ_ext series before the integration loop instead of calling get() per step.
+
+Both work from packed copies of the source lists that the add_* methods
+invalidate. Code that edits the lists directly must call refresh() before
+the next get() or sample().
 """
 
 import math
 import random
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
-from typing import List, Tuple
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+from simulation import kernels
+
+
+# Row tags for _PerturbBuffers.rows (see kernels.source_series)
+SRC_IMPULSE = 0   # (t0, mag)
+SRC_STEP = 1      # (t0, t1, mag)
+SRC_SINE = 2      # (amp, omega, phase, t0, t1)
+
+
+@dataclass(slots=True, frozen=True)
+class _PerturbBuffers:
+    """
+    Struct-of-arrays copy of the deterministic sources, built once per edit.
+
+    The per-kind arrays feed the NumPy evaluation in Perturbation.sample();
+    `rows` holds every source as one tagged (code, p0..p4) float64 table for
+    the fused compiled kernel.
+    """
+    imp_t0: np.ndarray
+    imp_mag: np.ndarray
+
+    # Steps as two sorted edge lists with cumulative magnitudes:
+    # active(t) = Σ mag[t0 <= t] - Σ mag[t1 < t]
+    step_t0: np.ndarray
+    step_cum_t0: np.ndarray
+    step_t1: np.ndarray
+    step_cum_t1: np.ndarray
+
+    sin_amp: np.ndarray
+    sin_w: np.ndarray
+    sin_phase: np.ndarray
+    sin_t0: np.ndarray
+    sin_t1: np.ndarray
+
+    rows: np.ndarray
+
+    @classmethod
+    def build(cls, impulses, steps, sines) -> "_PerturbBuffers":
+        imp = np.array(impulses, dtype=np.float64).reshape(-1, 2)
+        stp = np.array(steps, dtype=np.float64).reshape(-1, 3)
+        sin = np.array(sines, dtype=np.float64).reshape(-1, 5)
+        sin[:, 1] *= 2 * np.pi
+
+        by_start = np.argsort(stp[:, 0], kind="stable")
+        by_end = np.argsort(stp[:, 1], kind="stable")
+
+        rows = np.zeros((len(imp) + len(stp) + len(sin), 6))
+        i, j = len(imp), len(imp) + len(stp)
+        rows[:i, 0], rows[:i, 1:3] = SRC_IMPULSE, imp
+        rows[i:j, 0], rows[i:j, 1:4] = SRC_STEP, stp
+        rows[j:, 0], rows[j:, 1:6] = SRC_SINE, sin
+
+        return cls(
+            imp_t0=imp[:, 0],
+            imp_mag=imp[:, 1],
+            step_t0=stp[by_start, 0],
+            step_cum_t0=np.concatenate(([0.0], np.cumsum(stp[by_start, 2]))),
+            step_t1=stp[by_end, 1],
+            step_cum_t1=np.concatenate(([0.0], np.cumsum(stp[by_end, 2]))),
+            sin_amp=sin[:, 0],
+            sin_w=sin[:, 1],
+            sin_phase=sin[:, 2],
+            sin_t0=sin[:, 3],
+            sin_t1=sin[:, 4],
+            rows=rows,
+        )
 
 
-@dataclass
+@dataclass(slots=True)
 class Perturbation:
     # (t0, magnitude)
     impulses: List[Tuple[float, float]] = field(default_factory=list)
@@ -44,17 +120,35 @@ class Perturbation:
     # Random kicks: (magnitude, probability)
     random_kicks: List[Tuple[float, float]] = field(default_factory=list)
 
+    # Packed NumPy copies of the deterministic sources for sample(); None
+    # when stale (dropped by add_* and refresh())
+    _packed: Optional[_PerturbBuffers] = field(default=None, init=False, repr=False, compare=False)
+
+    # Scalar lookups for get(): impulses keyed by step index round(t0/dt),
+    # step edges as sorted lists and sine rows with omega = 2*pi*freq.
+    # Built from the packed arrays and dropped with them, or when the
+    # timestep changes: (impulse map, step edges, sines)
+    _dt: Optional[float] = field(default=None, init=False, repr=False, compare=False)
+    _lookup: Optional[tuple] = field(default=None, init=False, repr=False, compare=False)
+
+    # NumPy generator for the noise and kicks drawn by sample()
+    _rng: Optional[np.random.Generator] = field(default=None, init=False, repr=False, compare=False)
+
     # ------------------------------------------------------------------
     # Impulses
     # ------------------------------------------------------------------
     def add_impulse(self, t0: float, magnitude: float):
         self.impulses.append((t0, magnitude))
+        self._packed = None
+        self._lookup = None
 
     # ------------------------------------------------------------------
     # Steps
     # ------------------------------------------------------------------
     def add_step(self, t0: float, t1: float, magnitude: float):
         self.steps.append((t0, t1, magnitude))
+        self._packed = None
+        self._lookup = None
 
     # ------------------------------------------------------------------
     # Deterministic sine wave
@@ -68,6 +162,8 @@ class Perturbation:
         t_end: float = float("inf"),
     ):
         self.sine_waves.append((amplitude, freq, phase, t_start, t_end))
+        self._packed = None
+        self._lookup = None
 
     # ------------------------------------------------------------------
     # Random-phase sine wave
@@ -81,6 +177,27 @@ class Perturbation:
     ):
         phase = random.uniform(0, 2 * math.pi)
         self.rnd_phase_sine.append((amplitude, freq, phase, t_start, t_end))
+        self._packed = None
+        self._lookup = None
+
+    # ------------------------------------------------------------------
+    # Direct edits to the source lists
+    # ------------------------------------------------------------------
+    def refresh(self) -> None:
+        """Drop everything built from the sources; call after editing the lists directly."""
+        self._packed = None
+        self._lookup = None
+
+    def clear(self) -> None:
+        """Remove every disturbance source and turn the noise off."""
+        self.impulses.clear()
+        self.steps.clear()
+        self.sine_waves.clear()
+        self.rnd_phase_sine.clear()
+        self.random_kicks.clear()
+        self.noise_enable = False
+        self.noise_std = 0.0
+        self.refresh()
 
     # ------------------------------------------------------------------
     # Gaussian noise
@@ -89,6 +206,16 @@ class Perturbation:
         self.noise_enable = True
         self.noise_std = std
 
+    def seed(self, seed) -> None:
+        """Reseed the generator sample() draws noise and kicks from (int, SeedSequence or None)."""
+        self._rng = np.random.default_rng(seed)
+
+    def _generator(self) -> np.random.Generator:
+        if self._rng is None:
+            # Seeded from `random` so random.seed() still reproduces the noise
+            self._rng = np.random.default_rng(random.getrandbits(64))
+        return self._rng
+
     # ------------------------------------------------------------------
     # Random kicks
     # ------------------------------------------------------------------
@@ -100,26 +227,28 @@ class Perturbation:
     # ------------------------------------------------------------------
     def get(self, t: float) -> float:
         tau = 0.0
+        imp_map, edges, sines = self._lookup or self._scalar_lookup()
 
-        # Impulses
-        for t0, mag in self.impulses:
-            if abs(t - t0) < 1e-6:  # single-step pulse
-                tau += mag
+        # Impulses (single-step pulse)
+        if imp_map is not None:
+            for t0, mag in imp_map.get(round(t / self._dt), ()):
+                if abs(t - t0) < 1e-6:
+                    tau += mag
+        else:
+            for t0, mag in self.impulses:
+                if abs(t - t0) < 1e-6:
+                    tau += mag
 
-        # Steps
-        for t0, t1, mag in self.steps:
-            if t0 <= t <= t1:
-                tau += mag
-
-        # Deterministic sine waves
-        for amp, freq, phase, t0, t1 in self.sine_waves:
-            if t0 <= t <= t1:
-                tau += amp * math.sin(2 * math.pi * freq * t + phase)
+        # Steps: cumulative magnitude of started minus already-ended windows
+        if edges is not None:
+            start_t, start_cum, end_t, end_cum = edges
+            tau += start_cum[bisect_right(start_t, t)] - end_cum[bisect_left(end_t, t)]
 
-        # Random-phase sine waves
-        for amp, freq, phase, t0, t1 in self.rnd_phase_sine:
+        # Deterministic and random-phase sine waves, omega = 2*pi*freq precomputed
+        sin = math.sin
+        for amp, w, phase, t0, t1 in sines:
             if t0 <= t <= t1:
-                tau += amp * math.sin(2 * math.pi * freq * t + phase)
+                tau += amp * sin(w * t + phase)
 
         # Gaussian noise
         if self.noise_enable and self.noise_std > 0:
@@ -131,3 +260,114 @@ class Perturbation:
                 tau += mag
 
         return tau
+
+    # ------------------------------------------------------------------
+    # Scalar lookups for get()
+    # ------------------------------------------------------------------
+    def set_timestep(self, dt: float) -> None:
+        """Key impulses by step index so get() finds them in O(1)."""
+        self._dt = float(dt)
+        self._lookup = None
+
+    def _scalar_lookup(self) -> tuple:
+        if self._lookup is not None:
+            return self._lookup
+
+        p = self._packed_sources()
+        dt = self._dt
+        imp_map = None
+        if dt:
+            imp_map = {}
+            for t0, mag in self.impulses:
+                # Register under every step index the ±1e-6 match window touches
+                for k in {round((t0 - 1e-6) / dt), round((t0 + 1e-6) / dt)}:
+                    imp_map.setdefault(k, []).append((t0, mag))
+
+        edges = None
+        if self.steps:
+            edges = (
+                p.step_t0.tolist(),
+                p.step_cum_t0.tolist(),
+                p.step_t1.tolist(),
+                p.step_cum_t1.tolist(),
+            )
+
+        # (amp, omega, phase, t0, t1) rows from the packed arrays
+        sines = list(zip(p.sin_amp.tolist(), p.sin_w.tolist(), p.sin_phase.tolist(),
+                         p.sin_t0.tolist(), p.sin_t1.tolist()))
+
+        self._lookup = (imp_map, edges, sines)
+        return self._lookup
+
+    # ------------------------------------------------------------------
+    # Packed arrays (struct-of-arrays view of the source lists)
+    # ------------------------------------------------------------------
+    def _packed_sources(self) -> "_PerturbBuffers":
+        if self._packed is None:
+            self._packed = _PerturbBuffers.build(self.impulses, self.steps,
+                                                 self.sine_waves + self.rnd_phase_sine)
+        return self._packed
+
+    # ------------------------------------------------------------------
+    # Vectorized τ_ext over a time grid
+    # ------------------------------------------------------------------
+    def sample(
+        self,
+        ts: np.ndarray,
+        out: Optional[np.ndarray] = None,
+        rng: Optional[np.random.Generator] = None,
+    ) -> np.ndarray:
+        """
+        Evaluate τ_ext for every time in `ts`.
+
+        Same disturbance model as get(), one NumPy pass per source kind, or
+        a single fused compiled pass when Numba is installed. If `out`
+        is given, contributions are added into it in place and it is returned.
+        Random terms are drawn from `rng` if given, otherwise from the
+        internal generator (see seed()).
+        """
+        ts = np.asarray(ts, dtype=np.float64)
+        if out is None:
+            out = np.zeros(ts.shape, dtype=np.float64)
+        if rng is None:
+            rng = self._generator()
+
+        p = self._packed_sources()
+
+        if kernels.HAVE_NUMBA and p.rows.size and out.flags.c_contiguous:
+            # All deterministic sources in one compiled pass over the tagged rows
+            kernels.source_series(ts.ravel(), p.rows, out.reshape(-1))
+        else:
+            self._sample_sources(p, ts, out)
+
+        # Gaussian noise
+        if self.noise_enable and self.noise_std > 0:
+            out += rng.standard_normal(ts.shape) * self.noise_std
+
+        # Random kicks
+        for mag, prob in self.random_kicks:
+            out[rng.random(ts.shape) < prob] += mag
+
+        return out
+
+    @staticmethod
+    def _sample_sources(p: _PerturbBuffers, ts: np.ndarray, out: np.ndarray) -> None:
+        """Add impulses, steps and sines at `ts` into `out`, one NumPy pass per kind."""
+        tcol = ts.reshape(1, -1)
+
+        # Impulses (single-step pulse)
+        if p.imp_t0.size:
+            hit = np.abs(tcol - p.imp_t0[:, None]) < 1e-6
+            out += (p.imp_mag @ hit).reshape(ts.shape)
+
+        # Steps: cumulative magnitude of started minus already-ended windows
+        if p.step_t0.size:
+            started = p.step_cum_t0[np.searchsorted(p.step_t0, ts, side="right")]
+            ended = p.step_cum_t1[np.searchsorted(p.step_t1, ts, side="left")]
+            out += started - ended
+
+        # Deterministic and random-phase sine waves, all sources at once
+        if p.sin_amp.size:
+            active = (tcol >= p.sin_t0[:, None]) & (tcol <= p.sin_t1[:, None])
+            wave = np.sin(p.sin_w[:, None] * tcol + p.sin_phase[:, None])
+            out += (p.sin_amp @ (wave * active)).reshape(ts.shape)
@@ -52,40 +52,55 @@ Fixes:
     • Perturbation regions properly shaded
 """
 from __future__ import annotations
+import multiprocessing
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 import numpy as np
-import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from typing import Dict
 from simulation.carriage_simulator import CarriageSimulator
 
+try:
+    from joblib import Parallel, delayed
+    HAVE_JOBLIB = True
+except ImportError:  # joblib is optional
+    HAVE_JOBLIB = False
+
 
 # ============================================================
 # PERFORMANCE METRICS
 # ============================================================
 
-def compute_overshoot(theta: np.ndarray) -> float:
-    final = theta[-1]
-    peak = np.max(theta)
+# final / peak may be passed in when the caller has already computed them
+# (see compute_metrics); by default they are taken from theta.
+
+def compute_overshoot(theta: np.ndarray, final=None, peak=None) -> float:
+    final = theta[-1] if final is None else final
+    peak = np.max(theta) if peak is None else peak
     return max(0.0, peak - final)
 
 
-def compute_settling_time(t: np.ndarray, theta: np.ndarray, band: float = 0.02) -> float:
-    final = theta[-1]
+def compute_settling_time(t: np.ndarray, theta: np.ndarray, band: float = 0.02,
+                          final=None) -> float:
+    final = theta[-1] if final is None else final
     upper = final * (1 + band)
     lower = final * (1 - band)
-    for i in range(len(theta)):
-        window = theta[i:]
-        if np.all((window >= lower) & (window <= upper)):
-            return t[i]
-    return t[-1]
+
+    # Settled from the sample after the last excursion outside the band
+    outside = np.flatnonzero((theta < lower) | (theta > upper))
+    idx = outside[-1] + 1 if outside.size else 0
+    return t[idx] if idx < len(t) else t[-1]
 
 
 def estimate_damping_ratio(theta: np.ndarray, t: np.ndarray) -> float:
-    peaks = []
-    for i in range(1, len(theta) - 1):
-        if theta[i] > theta[i-1] and theta[i] > theta[i+1]:
-            peaks.append(theta[i])
+    # Strict local maxima, found with one mask over the interior samples
+    mid = theta[1:-1]
+    peaks = mid[(mid > theta[:-2]) & (mid > theta[2:])]
 
-    if len(peaks) < 2:
+    if peaks.size < 2:
         return 1.0
 
     x1, x2 = peaks[0], peaks[1]
@@ -97,25 +112,42 @@ def estimate_damping_ratio(theta: np.ndarray, t: np.ndarray) -> float:
 
 
 def compute_rise_time(t: np.ndarray, theta: np.ndarray,
-                      start_frac=0.1, end_frac=0.9) -> float:
-    peak = np.max(theta)
+                      start_frac=0.1, end_frac=0.9, peak=None) -> float:
+    peak = np.max(theta) if peak is None else peak
     th_start = peak * start_frac
     th_end = peak * end_frac
 
-    t_start = None
-    t_end = None
+    # First crossing of the start level, then of the end level from there on
+    above_start = np.flatnonzero(theta >= th_start)
+    if not above_start.size:
+        return np.nan
+    i_start = above_start[0]
 
-    for i, th in enumerate(theta):
-        if t_start is None and th >= th_start:
-            t_start = t[i]
-        if t_start is not None and th >= th_end:
-            t_end = t[i]
-            break
+    above_end = np.flatnonzero(theta[i_start:] >= th_end)
+    if not above_end.size:
+        return np.nan
 
-    if t_start is not None and t_end is not None:
-        return t_end - t_start
+    return t[i_start + above_end[0]] - t[i_start]
+
+
+def compute_metrics(t: np.ndarray, theta: np.ndarray, band: float = 0.02) -> Dict[str, float]:
+    """
+    All four metrics over one contiguous float64 copy of the logs.
+
+    Calls the individual compute_*/estimate_* functions, with the final
+    value and peak found once and passed to each.
+    """
+    t = np.ascontiguousarray(t, dtype=np.float64)
+    theta = np.ascontiguousarray(theta, dtype=np.float64)
+    final = theta[-1]
+    peak = theta.max()
 
-    return np.nan
+    return {
+        "overshoot": compute_overshoot(theta, final=final, peak=peak),
+        "settling": compute_settling_time(t, theta, band, final=final),
+        "zeta": estimate_damping_ratio(theta, t),
+        "rise": compute_rise_time(t, theta, peak=peak),
+    }
 
 
 # ============================================================
@@ -123,18 +155,19 @@ def compute_rise_time(t: np.ndarray, theta: np.ndarray,
 # ============================================================
 
 def overlay_perturbations(ax, ax_ext, sim: CarriageSimulator):
-    t = np.array(sim.log_t)
-    tau_ext = np.array(sim.log_tau_ext)
+    t = np.asarray(sim.log_t)
+    tau_ext = np.asarray(sim.log_tau_ext)
 
     if np.all(tau_ext == 0):
         return
 
     ax_ext.plot(t, tau_ext, 'r-.', linewidth=1.8, label="external torque (Nm)")
 
-    # Impulse = sharp sudden change
-    for i in range(1, len(tau_ext)):
-        if abs(tau_ext[i] - tau_ext[i-1]) > 0.15:
-            ax.axvline(t[i], color='red', linestyle='--', alpha=0.5)
+    # Impulse = sharp sudden change; one LineCollection for all markers
+    idx = np.flatnonzero(np.abs(np.diff(tau_ext)) > 0.15) + 1
+    if idx.size:
+        ax.vlines(t[idx], 0, 1, transform=ax.get_xaxis_transform(),
+                  color='red', linestyle='--', alpha=0.5)
 
     # Step region = sustained nonzero interval
     nz = np.where(np.abs(tau_ext) > 1e-4)[0]
@@ -200,60 +233,125 @@ def annotate_perturbations(ax, sim: CarriageSimulator):
 # MAIN PLOTTING FUNCTION
 # ============================================================
 
-def plot_sim_results(sim: CarriageSimulator, title="Carriage Simulation Results"):
-    t = np.array(sim.log_t)
-    theta = np.array(sim.log_theta)
-    omega = np.array(sim.log_omega)
-    tau_m = np.array(sim.log_tau_m)
-    tau_g = np.array(sim.log_tau_g)
-    cmd = np.array(sim.log_cmd)
+# Figure reused across batch (show=False) calls: built once on the Agg
+# canvas, then only the line data and perturbation overlays are replaced
+_FIG_CACHE: Dict[str, dict] = {}
 
-    fig, ax = plt.subplots(figsize=(11, 6))
+
+def _build_figure(interactive: bool, annotations: bool = True) -> dict:
+    if interactive:
+        # pyplot (and its GUI backend) is only needed to show a window
+        import matplotlib.pyplot as plt
+        fig = plt.figure(figsize=(11, 6))
+    else:
+        fig = Figure(figsize=(11, 6))
+        FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
 
     # Left axis signals
-    ax.plot(t, theta, label="theta (rad)")
-    ax.plot(t, omega, label="omega (rad/s)")
-    ax.plot(t, tau_m, label="motor torque (Nm)")
-    ax.plot(t, tau_g, 'r--', label="gravity torque (Nm)")
+    lines = {
+        "theta": ax.plot([], [], label="theta (rad)")[0],
+        "omega": ax.plot([], [], label="omega (rad/s)")[0],
+        "tau_m": ax.plot([], [], label="motor torque (Nm)")[0],
+        "tau_g": ax.plot([], [], 'r--', label="gravity torque (Nm)")[0],
+    }
 
     ax.set_xlabel("Time (s)")
     ax.set_ylabel("Angle / Motor / Gravity Torque")
-    ax.set_title(title)
 
     # Right-axis for motor command
     ax_cmd = ax.twinx()
-    ax_cmd.plot(t, cmd, color='gray', alpha=0.5, label="motor command")
+    lines["cmd"] = ax_cmd.plot([], [], color='gray', alpha=0.5, label="motor command")[0]
     ax_cmd.set_ylabel("Motor Command", color='gray')
     ax_cmd.tick_params(axis='y', labelcolor='gray')
 
-    # Right-outer-axis for external torque
-    ax_ext = ax.twinx()
-    ax_ext.spines["right"].set_position(("axes", 1.12))
-    ax_ext.set_ylabel("External Torque (Nm)", color='red')
-    ax_ext.tick_params(axis='y', labelcolor='red')
+    # Right-outer-axis for external torque (only drawn with annotations)
+    ax_ext = None
+    if annotations:
+        ax_ext = ax.twinx()
+        ax_ext.spines["right"].set_position(("axes", 1.12))
+        ax_ext.set_ylabel("External Torque (Nm)", color='red')
+        ax_ext.tick_params(axis='y', labelcolor='red')
+
+    return {"fig": fig, "ax": ax, "ax_cmd": ax_cmd, "ax_ext": ax_ext, "lines": lines}
+
+
+def _clear_overlays(parts: dict):
+    """Drop the perturbation overlay artists from a reused figure."""
+    ax, ax_ext = parts["ax"], parts["ax_ext"]
+    ext_lines = ax_ext.lines if ax_ext is not None else ()
+    for artist in [*ext_lines, *ax.collections, *ax.patches, *ax.texts]:
+        artist.remove()
+
+
+def plot_sim_results(sim: CarriageSimulator, title="Carriage Simulation Results",
+                     max_points: int = 5000, save_path=None, show: bool = True,
+                     annotations: bool = True):
+    """
+    Plot the simulation logs and print performance metrics.
+
+    With show=False nothing is displayed: the plot is drawn on a cached
+    off-screen Agg figure that later calls reuse, which suits batch runs
+    that only need save_path. annotations=False leaves out the external
+    torque axis, the perturbation overlay and the text box.
+    """
+    t = np.asarray(sim.log_t)
+    theta = np.asarray(sim.log_theta)
+    omega = np.asarray(sim.log_omega)
+    tau_m = np.asarray(sim.log_tau_m)
+    tau_g = np.asarray(sim.log_tau_g)
+    cmd = np.asarray(sim.log_cmd)
+
+    if show:
+        parts = _build_figure(interactive=True, annotations=annotations)
+    else:
+        key = "batch" if annotations else "batch-plain"
+        parts = _FIG_CACHE.get(key)
+        if parts is None:
+            parts = _FIG_CACHE[key] = _build_figure(interactive=False, annotations=annotations)
+        else:
+            _clear_overlays(parts)
+    fig, ax, ax_cmd, ax_ext = parts["fig"], parts["ax"], parts["ax_cmd"], parts["ax_ext"]
+
+    # Draw at most ~max_points per line (draw time is linear in points);
+    # metrics below still use the full logs
+    sl = slice(None, None, max(1, -(-t.size // max_points)))
+    for name, series in (("theta", theta), ("omega", omega), ("tau_m", tau_m),
+                         ("tau_g", tau_g), ("cmd", cmd)):
+        parts["lines"][name].set_data(t[sl], series[sl])
+    for axis in (ax, ax_cmd):
+        axis.relim()
+        axis.autoscale_view()
+    ax.set_title(title)
 
-    overlay_perturbations(ax, ax_ext, sim)
-    annotate_perturbations(ax, sim)
+    lines = ax.get_lines() + ax_cmd.get_lines()
+    if annotations:
+        overlay_perturbations(ax, ax_ext, sim)
+        annotate_perturbations(ax, sim)
+        # A reused figure still holds the previous run's external torque limits
+        ax_ext.relim()
+        ax_ext.autoscale_view()
+        lines += ax_ext.get_lines()
 
     # Build combined legend
-    lines = ax.get_lines() + ax_cmd.get_lines() + ax_ext.get_lines()
     labels = [ln.get_label() for ln in lines]
     ax.legend(lines, labels, loc="upper right")
 
-    plt.tight_layout()
-    plt.show()
+    fig.tight_layout()
+    if save_path:
+        fig.savefig(save_path)
+    if show:
+        import matplotlib.pyplot as plt
+        plt.show()
 
     # Performance metrics
     print("\n=== PERFORMANCE METRICS ===")
-    overshoot = compute_overshoot(theta)
-    settling = compute_settling_time(t, theta)
-    zeta = estimate_damping_ratio(theta, t)
-    rise = compute_rise_time(t, theta)
-
-    print(f"Overshoot:     {overshoot:.5f} rad")
-    print(f"Settling time: {settling:.3f} s")
-    print(f"ζ estimate:    {zeta:.3f}")
-    print(f"Rise time:     {rise:.3f} s")
+    m = compute_metrics(t, theta)
+
+    print(f"Overshoot:     {m['overshoot']:.5f} rad")
+    print(f"Settling time: {m['settling']:.3f} s")
+    print(f"ζ estimate:    {m['zeta']:.3f}")
+    print(f"Rise time:     {m['rise']:.3f} s")
     print("====================================\n")
 
 
@@ -261,31 +359,101 @@ def plot_sim_results(sim: CarriageSimulator, title="Carriage Simulation Results"
 # MONTE CARLO TESTING
 # ============================================================
 
-def monte_carlo_test(sim_factory, N=40) -> Dict[str, float]:
-    results = {"zeta": [], "overshoot": [], "settling": []}
-
-    for _ in range(N):
-        sim = sim_factory()
-
-        # Randomized disturbances
-        sim.perturb.add_impulse(5.0, np.random.uniform(0.2, 0.45))
-        sim.perturb.add_step(10.0, 15.0, np.random.uniform(0.025, 0.075))
-        sim.perturb.add_noise(np.random.uniform(0.0, 0.01))
-
-        sim.run(20.0)
-
-        t = np.array(sim.log_t)
-        theta = np.array(sim.log_theta)
-
-        results["zeta"].append(estimate_damping_ratio(theta, t))
-        results["overshoot"].append(compute_overshoot(theta))
-        results["settling"].append(compute_settling_time(t, theta))
+def _one_trial(args) -> tuple:
+    """
+    One Monte-Carlo trial: (zeta, overshoot, settling) for a seeded run,
+    followed by the t and theta logs when keep_logs is set.
+    """
+    seed_seq, sim_factory, impulse, step, noise, duration, keep_logs = args
+
+    sim = sim_factory()
+    sim.perturb.seed(seed_seq)
+
+    # Randomized disturbances (magnitudes drawn up front by monte_carlo_test)
+    sim.perturb.add_impulse(5.0, impulse)
+    sim.perturb.add_step(10.0, 15.0, step)
+    sim.perturb.add_noise(noise)
+
+    sim.run(duration)
+
+    m = compute_metrics(sim.log_t, sim.log_theta)
+    metrics = m["zeta"], m["overshoot"], m["settling"]
+    if keep_logs:
+        return metrics, sim.log_t.copy(), sim.log_theta.copy()
+    return metrics
+
+
+def monte_carlo_test(sim_factory, N=40, seed=None, max_workers=None,
+                     save_trajectories_npz=None, duration=20.0) -> Dict[str, np.ndarray]:
+    """
+    Run N randomized-disturbance trials of sim_factory() across CPU cores,
+    each `duration` seconds long.
+
+    All N disturbance magnitudes are drawn in one vectorized call per
+    parameter from a Generator seeded by SeedSequence(seed); each trial's
+    noise uses its own child sequence. A given seed therefore reproduces
+    the same results however the trials are scheduled.
+
+    When joblib is installed the trials run on its loky workers, which are
+    reused between calls and serialize with cloudpickle, so lambdas and
+    closures parallelize too. Without joblib a ProcessPoolExecutor is used
+    and factories that cannot be pickled run serially; on POSIX its workers
+    are forked, after one warm-up sim_factory() call in this process, so
+    they start with the simulator modules and config already loaded. Each
+    trial returns only its three scalar metrics unless save_trajectories_npz
+    is given: then every trial's t and theta logs are also collected and
+    written as (N, samples) arrays to that .npz file with
+    np.savez_compressed, for plotting offline instead of during the sweep.
+    """
+    root = np.random.SeedSequence(seed)
+    rng = np.random.default_rng(root)
+    impulses = rng.uniform(0.2, 0.45, N)
+    steps = rng.uniform(0.025, 0.075, N)
+    noises = rng.uniform(0.0, 0.01, N)
+
+    keep_logs = save_trajectories_npz is not None
+    jobs = list(zip(root.spawn(N), repeat(sim_factory),
+                    impulses.tolist(), steps.tolist(), noises.tolist(),
+                    repeat(duration), repeat(keep_logs)))
+
+    workers = max_workers or os.cpu_count() or 1
+    if not HAVE_JOBLIB:
+        try:
+            pickle.dumps(sim_factory)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            workers = 1
+
+    if workers == 1 or N <= 1:
+        rows = [_one_trial(job) for job in jobs]
+    elif HAVE_JOBLIB:
+        rows = Parallel(n_jobs=workers, backend="loky", batch_size="auto")(
+            delayed(_one_trial)(job) for job in jobs)
+    else:
+        ctx = None
+        if "fork" in multiprocessing.get_all_start_methods():
+            ctx = multiprocessing.get_context("fork")
+            sim_factory()   # warm imports/config caches before forking
+        with ProcessPoolExecutor(max_workers=workers, mp_context=ctx) as executor:
+            rows = list(executor.map(_one_trial, jobs))
+
+    if keep_logs:
+        n_samples = rows[0][1].size
+        t_all = np.empty((N, n_samples))
+        theta_all = np.empty((N, n_samples))
+        for i, (_, t_i, theta_i) in enumerate(rows):
+            t_all[i] = t_i
+            theta_all[i] = theta_i
+        np.savez_compressed(save_trajectories_npz, t=t_all, theta=theta_all)
+        rows = [row[0] for row in rows]
+
+    table = np.array(rows, dtype=np.float64).reshape(N, 3)
+    results = {"zeta": table[:, 0], "overshoot": table[:, 1], "settling": table[:, 2]}
 
     print(f"\n===== MONTE CARLO RESULTS (N={N}) =====")
-    print(f"ζ mean  = {np.mean(results['zeta']):.3f}")
-    print(f"ζ std   = {np.std(results['zeta']):.3f}")
-    print(f"Overshoot mean = {np.mean(results['overshoot']):.4f}")
-    print(f"Settling mean  = {np.mean(results['settling']):.3f}")
+    print(f"ζ mean  = {results['zeta'].mean():.3f}")
+    print(f"ζ std   = {results['zeta'].std():.3f}")
+    print(f"Overshoot mean = {results['overshoot'].mean():.4f}")
+    print(f"Settling mean  = {results['settling'].mean():.3f}")
     print("==========================================")
 
     return results
\ No newline at end of file
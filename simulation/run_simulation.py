@@ -5,18 +5,25 @@ from __future__ import annotations
 
 import math
 import os
-import tomllib
 from dataclasses import dataclass
 
-from simulation.central_config import load_simulation_config
+from simulation.central_config import load_toml, load_simulation_config
 from simulation.carriage_simulator import CarriageSimulator
 from simulation.plot_sim_results import plot_sim_results
 from flc.controller import FLCController
 
+# Paths are fixed relative to this file, so resolve them once at import
+_REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(__file__), ".."))
+_CFG_DIR = os.path.join(_REPO_ROOT, "config")
+_SIM_CFG_PATH = os.path.join(_CFG_DIR, "sim_config.toml")
+_IMU_CFG_PATH = os.path.join(_CFG_DIR, "imu_config.toml")
 
-def _load_toml(path: str) -> dict:
-    with open(path, "rb") as f:
-        return tomllib.load(f)
+
+def _resolve_flc_path(sim_cfg_toml: dict) -> str:
+    flc_path = sim_cfg_toml.get("controller", {}).get("FLC_CONFIG_PATH", "config/flc_config.toml")
+    if not os.path.isabs(flc_path):
+        flc_path = os.path.normpath(os.path.join(_REPO_ROOT, flc_path))
+    return flc_path
 
 
 @dataclass
@@ -34,13 +41,21 @@ class SimIMUDevice:
         p = controller_params or {}
         self.accel_1g = float(p.get("ACCEL_1G_RAW", 16384.0))
         self.omega_max = float(p.get("OMEGA_MAX_RAD_S", 1.0))
-
-    def read_all_axes(self):
-        ax = int(math.sin(_STATE.theta) * self.accel_1g)
-        az = int(-math.cos(_STATE.theta) * self.accel_1g)
+        self._inv_omega_max = 1.0 / self.omega_max
+
+    def read_all_axes(self, sin=math.sin, cos=math.cos, state=_STATE):
+        # Called once per simulation step: math functions and the shared
+        # state are bound as defaults so the body only reads locals
+        theta = state.theta
+        a1g = self.accel_1g
+        ax = int(sin(theta) * a1g)
+        az = int(-cos(theta) * a1g)
         ay = 0
 
-        gy = int(max(-1.0, min(1.0, _STATE.omega / self.omega_max)) * 32768.0)
+        w = state.omega * self._inv_omega_max
+        if not -1.0 <= w <= 1.0:
+            w = 1.0 if w > 0.0 else -1.0
+        gy = int(w * 32768.0)
         return ax, ay, az, 0, gy, 0
 
     def close(self):
@@ -48,25 +63,17 @@ class SimIMUDevice:
 
 
 def main():
-    plant, motor, sim_cfg, duration, _ctrl, ic = load_simulation_config()
-
-    cfg_dir = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", "config"))
-    sim_cfg_toml = _load_toml(os.path.join(cfg_dir, "sim_config.toml"))
-
-    ctrl_cfg = sim_cfg_toml.get("controller", {})
-    flc_path = ctrl_cfg.get("FLC_CONFIG_PATH", "config/flc_config.toml")
-    if not os.path.isabs(flc_path):
-        flc_path = os.path.normpath(os.path.join(os.path.dirname(__file__), "..", flc_path))
+    plant, motor, sim_cfg, duration, _ctrl, ic = load_simulation_config(_SIM_CFG_PATH)
 
-    flc_cfg = _load_toml(flc_path)
+    sim_cfg_toml = load_toml(_SIM_CFG_PATH)
+    flc_cfg = load_toml(_resolve_flc_path(sim_cfg_toml))
     flc = FLCController(flc_cfg)
 
     scale = flc_cfg.get("scaling", {})
     theta_max = float(scale.get("THETA_MAX_RAD", math.pi / 2))
     omega_max = float(scale.get("OMEGA_MAX_RAD_S", 10.0))
 
-    imu_cfg_path = os.path.join(cfg_dir, "imu_config.toml")
-    imu_cfg = _load_toml(imu_cfg_path) if os.path.exists(imu_cfg_path) else {}
+    imu_cfg = load_toml(_IMU_CFG_PATH) if os.path.exists(_IMU_CFG_PATH) else {}
     ctrl_params = dict(imu_cfg.get("controller_params", {}) or {})
     iir_params = dict(imu_cfg.get("iir_params", {}) or {})
 
@@ -82,12 +89,14 @@ def main():
 
     imu = imu_mod.IMU_Driver(iir_params, ctrl_params)
 
-    def controller(theta, omega, t):
-        _STATE.theta = theta
-        _STATE.omega = omega
-        _STATE.t = t
-        th_n, om_n = imu.read_normalized()
-        return flc.calculate_motor_cmd(th_n, om_n)
+    # Per-step path: the shared state and bound methods are resolved once
+    def controller(theta, omega, t, state=_STATE, read=imu.read_normalized,
+                   calculate=flc.calculate_motor_cmd):
+        state.theta = theta
+        state.omega = omega
+        state.t = t
+        th_n, om_n = read()
+        return calculate(th_n, om_n)
 
     sim = CarriageSimulator(plant, motor, sim_cfg, controller)
 
@@ -1,7 +1,10 @@
 import sys
+import tomllib
 import types
 import pytest
 
+FLC_CONFIG_PATH = "config/flc_config.toml"
+
 
 class FakeI2CHost:
     """
@@ -107,3 +110,15 @@ def install_fake_pigpio_module(monkeypatch):
     m.error = _Err
     monkeypatch.setitem(sys.modules, "pigpio", m)
     return m
+
+
+@pytest.fixture(scope="session")
+def flc_config():
+    """
+    config/flc_config.toml, parsed once per test session.
+
+    Shared by every test that needs it; FLCController only reads the dict,
+    so treat it as read-only.
+    """
+    with open(FLC_CONFIG_PATH, "rb") as f:
+        return tomllib.load(f)
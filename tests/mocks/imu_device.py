@@ -0,0 +1,34 @@
+"""
+Scripted stand-in for the IMU device behind hardware.imu_driver.
+
+IMU_Driver builds its device through the module-level `_IMUDevice` factory;
+tests patch that factory to return a SeqIMUDevice fed with raw samples:
+
+    monkeypatch.setattr(imu, "_IMUDevice",
+                        lambda controller_params=None: SeqIMUDevice(seq))
+"""
+
+
+class SeqIMUDevice:
+    """
+    Returns a programmable sequence of (AX, AY, AZ, GX, GY, GZ) samples,
+    then keeps repeating the last one. An empty sequence reads as a level,
+    motionless sensor.
+    """
+
+    REST = (0, 0, -16384, 0, 0, 0)
+
+    def __init__(self, seq=None, controller_params=None, **_kw):
+        self._seq = list(seq or [self.REST])
+        self._i = 0
+        self.closed = False
+
+    def read_all_axes(self):
+        i = self._i
+        if i < len(self._seq):
+            self._i = i + 1
+            return self._seq[i]
+        return self._seq[-1]
+
+    def close(self):
+        self.closed = True
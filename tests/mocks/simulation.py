@@ -4,7 +4,15 @@ import logging
 import math
 import os
 import random
-from typing import Tuple
+from typing import List, Optional, Tuple
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # Numba is optional: _integrate_rim then runs as plain Python
+    def njit(*args, **kwargs):
+        return lambda fn: fn
 
 # simulation.py
 
@@ -29,7 +37,62 @@ def setup_sim_logging(log_path: str = "logs/simulation.log") -> None:
 
 
 
-@dataclass
+def _make_noise(rng: random.Random, span: int, block: int = 4096):
+    """
+    Return a zero-arg sampler of uniform ints in [-span, +span].
+
+    Samples are drawn `block` at a time with NumPy (seeded from `rng`) and
+    handed out from a plain list, so a step pays one list pop per draw
+    instead of a randint call.
+    """
+    if span <= 0:
+        return lambda: 0
+    buf: List[int] = []
+    pop = buf.pop
+
+    def noise() -> int:
+        if not buf:
+            gen = np.random.default_rng(rng.getrandbits(64))
+            buf.extend(gen.integers(-span, span, size=block, endpoint=True).tolist())
+        return pop()
+
+    return noise
+
+
+@njit(cache=True)
+def _integrate_rim(theta, omega, dt, accels, g, thetas, omegas):
+    """
+    The step() dynamics over arrays, compiled when Numba is present.
+
+    accels holds the motor acceleration for each step; thetas/omegas are
+    filled with the state after each step.
+    """
+    for i in range(accels.shape[0]):
+        alpha = accels[i] + g * math.sin(theta)
+        omega += alpha * dt
+        theta += omega * dt
+        if theta > 2.0:
+            theta = 2.0
+            if alpha > 0 or omega > 0:
+                omega = 0.0
+        elif theta < -2.0:
+            theta = -2.0
+            if alpha < 0 or omega < 0:
+                omega = 0.0
+        thetas[i] = theta
+        omegas[i] = omega
+
+
+def _clip_raw(v: int, lim: int) -> int:
+    return v if -lim <= v <= lim else (lim if v > 0 else -lim)
+
+
+def _clip_raw_vec(arr: np.ndarray, lim: int) -> np.ndarray:
+    """_clip_raw() over a whole batch of raw counts (one C loop)."""
+    return arr.clip(-lim, lim, out=arr)
+
+
+@dataclass(slots=True, frozen=True)
 class SimParams:
     # timing
     sample_rate_hz: float
@@ -52,12 +115,17 @@ class SimParams:
     raw_limit: int = 16384 # convenience, clamp target
 
     def __post_init__(self) -> None:
-        self.sample_rate_hz = float(self.sample_rate_hz or 50.0)
-        self.duration_s = float(self.duration_s or 10.0)
-        self.dt = 1.0 / self.sample_rate_hz
-        self.steps = int(self.duration_s * self.sample_rate_hz)
-        self.accel_raw_fs = int(self.accel_raw_fs or 16384)
-        self.raw_limit = int(self.accel_raw_fs)
+        # Frozen: derived fields are filled in once, here
+        set_ = object.__setattr__
+        rate = float(self.sample_rate_hz or 50.0)
+        duration = float(self.duration_s or 10.0)
+        fs = int(self.accel_raw_fs or 16384)
+        set_(self, "sample_rate_hz", rate)
+        set_(self, "duration_s", duration)
+        set_(self, "dt", 1.0 / rate)
+        set_(self, "steps", int(duration * rate))
+        set_(self, "accel_raw_fs", fs)
+        set_(self, "raw_limit", fs)
 
 
 class CarriageSimulator:
@@ -92,19 +160,38 @@ class CarriageSimulator:
         omega <- omega + alpha * dt
         theta <- theta + omega * dt
 
+      θ is advanced with the *updated* ω (semi-implicit / symplectic Euler),
+      which stays stable at larger dt than explicit Euler, so a lower
+      sample_rate_hz needs fewer steps for the same duration.
+
     IMU synthesis (raw-like):
         x_raw = int(ACCEL_RAW_FS * sin(theta)) + randint(-NOISE_SPAN, +NOISE_SPAN)
         y_raw = int(ACCEL_RAW_FS * cos(theta)) + randint(-NOISE_SPAN, +NOISE_SPAN)
         omega_raw = int(ACCEL_RAW_FS * clamp(omega / GYRO_FS_RAD_S, -1, +1))
     """
-    def __init__(self, p: SimParams, *, log_path: str = "logs/simulation.log"):
+    def __init__(self, p: SimParams, *, log_path: str = "logs/simulation.log",
+                 log_every: int = 1):
         setup_sim_logging(log_path)
         self.log = logging.getLogger("simulation")
+        # Per-step DEBUG line is written every `log_every` steps
+        self._log_every = max(1, int(log_every))
+        self._i = 0
 
         self.p = p
         self.theta = float(p.theta0_rad)
         self.omega = float(p.omega0_rad_s)
         self.motor_cmd = 0.0
+        self._frames: Optional[List[Tuple[int, int, int, float, float]]] = None
+        self._k = 0
+        # (theta, sin(theta)) from the last IMU synthesis, reused by the next
+        # step's gravity term while theta is unchanged
+        self._sin_cache: Tuple[float, float] = (math.nan, 0.0)
+        # Private stream, seeded from `random` so random.seed() still
+        # reproduces a run
+        self._rng = random.Random(random.getrandbits(64))
+        self._noise = _make_noise(self._rng, int(p.noise_span))
+        # 0.0 disables the gyro channel (omega_raw stays 0)
+        self._inv_gyro_fs = 1.0 / p.gyro_fs_rad_s if p.gyro_fs_rad_s > 0 else 0.0
 
         # Header: dump all params once at the very top of the log
         self.log.info("===== Simulation Parameters =====")
@@ -119,53 +206,160 @@ class CarriageSimulator:
         mc = max(-1.0, min(1.0, float(u)))
         if mc != self.motor_cmd:
             self.log.debug("motor_cmd updated: %.3f -> %.3f", self.motor_cmd, mc)
+            # Prebaked frames assumed the old command
+            self._frames = None
         self.motor_cmd = mc
 
-    def step(self) -> Tuple[int, int, int, float, float]:
+    def _integrate_batch(self, n: int, motor_cmds=None):
+        """
+        Integrate n steps from the current state without changing it.
+
+        motor_cmds, if given, holds one command per step (clamped to ±1);
+        otherwise the current motor_cmd is held. Returns (thetas, omegas).
+        """
+        p = self.p
+        dt = p.dt
+        mass = max(1e-9, p.carriage_mass_kg)
+        if motor_cmds is None:
+            accels = np.full(n, (p.motor_force_n * self.motor_cmd) / mass)
+        else:
+            cmds = np.clip(np.asarray(motor_cmds, dtype=np.float64)[:n], -1.0, 1.0)
+            accels = cmds * (p.motor_force_n / mass)
+        g = p.gravity_m_s2
+        theta, omega = self.theta, self.omega
+
+        thetas = np.empty(n)
+        omegas = np.empty(n)
+        _integrate_rim(theta, omega, dt, accels, g, thetas, omegas)
+        return thetas, omegas
+
+    def _synthesize_batch(self, thetas, omegas):
+        """IMU counts for a whole trajectory: a (3, n) array of x, y, omega raw."""
+        p = self.p
+        n = thetas.size
+        fs = p.accel_raw_fs
+        span = p.noise_span
+        rng = np.random.default_rng(self._rng.getrandbits(64))
+        noise = rng.integers(-span, span, size=(2, n), endpoint=True)
+        x_raw = (fs * np.sin(thetas)).astype(np.int64) + noise[0]
+        y_raw = (fs * np.cos(thetas)).astype(np.int64) + noise[1]
+        # Same reciprocal multiply as step(); 0.0 disables the channel
+        omega_norm = np.clip(omegas * self._inv_gyro_fs, -1.0, 1.0)
+        omega_raw = (fs * omega_norm).astype(np.int64)
+        return _clip_raw_vec(np.stack((x_raw, y_raw, omega_raw)), p.raw_limit)
+
+    def run_batch(self, n_steps: int, motor_cmd_arr=None):
+        """
+        Advance the plant `n_steps` at once for offline runs.
+
+        `motor_cmd_arr` gives the command for each step (the current
+        motor_cmd is held when omitted); ValueError if it is shorter than
+        `n_steps`. The dynamics loop stays scalar,
+        since gravity depends on θ, but the IMU synthesis, noise and clamping
+        run once over the whole batch. Returns NumPy arrays
+        (x_raw, y_raw, omega_raw, theta, omega), one entry per step, and
+        leaves the plant in the final state. Any prebaked frames are dropped.
+        """
+        if motor_cmd_arr is not None and len(motor_cmd_arr) < n_steps:
+            raise ValueError(
+                f"motor_cmd_arr has {len(motor_cmd_arr)} entries for {n_steps} steps")
+        thetas, omegas = self._integrate_batch(n_steps, motor_cmd_arr)
+        raw = self._synthesize_batch(thetas, omegas)
+
+        self._frames = None
+        if n_steps:
+            self.theta, self.omega = float(thetas[-1]), float(omegas[-1])
+            if motor_cmd_arr is not None:
+                self.motor_cmd = max(-1.0, min(1.0, float(motor_cmd_arr[n_steps - 1])))
+
+        self.log.info("batch of %d steps -> theta= %.3f rad, omega= %.3f rad/s",
+                      n_steps, self.theta, self.omega)
+        return raw[0], raw[1], raw[2], thetas, omegas
+
+    def prebake(self, n: int) -> None:
+        """
+        Precompute the next `n` steps at the current motor_cmd.
+
+        Uses the same batch integration and IMU synthesis as run_batch(), but
+        the plant state only advances as step() hands out the stored tuples.
+        The per-step log lines are replaced by a single summary line.
+        Changing motor_cmd drops whatever frames are left.
+        """
+        thetas, omegas = self._integrate_batch(n)
+        raw = self._synthesize_batch(thetas, omegas).tolist()
+        self._frames = list(zip(raw[0], raw[1], raw[2], thetas.tolist(), omegas.tolist()))
+        self._k = 0
+
+        self.log.info("prebaked %d steps at motor_cmd= %.3f", n, self.motor_cmd)
+
+    def step(self, sin=math.sin, cos=math.cos, clip=_clip_raw) -> Tuple[int, int, int, float, float]:
+        # sin/cos/clip are bound as defaults so the body does local lookups
+        frames = self._frames
+        if frames is not None:
+            k = self._k
+            if k < len(frames):
+                self._k = k + 1
+                self._i += 1
+                frame = frames[k]
+                self.theta, self.omega = frame[3], frame[4]
+                return frame
+            self._frames = None
+
         theta_lo, theta_hi = -2.0,  2.0
+        i = self._i
+        self._i = i + 1
+        p = self.p
+        theta, omega = self.theta, self.omega
 
         # --- dynamics ---
-        mass = max(1e-9, self.p.carriage_mass_kg)
-        motor_accel = (self.p.motor_force_n * self.motor_cmd) / mass
-        grav_accel  = self.p.gravity_m_s2 * math.sin(self.theta)
+        mass = max(1e-9, p.carriage_mass_kg)
+        motor_accel = (p.motor_force_n * self.motor_cmd) / mass
+        th, sin_th = self._sin_cache
+        if th != theta:
+            sin_th = sin(theta)
+        grav_accel  = p.gravity_m_s2 * sin_th
         alpha       = motor_accel + grav_accel
 
-        self.omega += alpha * self.p.dt
-        self.theta += self.omega * self.p.dt
+        dt = p.dt
+        omega += alpha * dt
+        theta += omega * dt
 
         # --- limit θ with “hold at limit” behavior ---
-        if self.theta > theta_hi:
-            self.theta = theta_hi
-            # If acceleration is pushing farther from 0 at +limit, don't allow outward motion
-            if alpha > 0 or self.omega > 0:
-                self.omega = 0.0
-        elif self.theta < theta_lo:
-            self.theta = theta_lo
-            # If acceleration is pushing farther from 0 at -limit, don't allow outward motion
-            if alpha < 0 or self.omega < 0:
-                self.omega = 0.0
+        # Inside the limits (the usual case) this is a single chained compare
+        if not theta_lo <= theta <= theta_hi:
+            out_hi = theta > theta_hi
+            theta = theta_hi if out_hi else theta_lo
+            # If acceleration or motion is pushing farther out, stop at the limit
+            if (alpha > 0 or omega > 0) if out_hi else (alpha < 0 or omega < 0):
+                omega = 0.0
+        self.theta, self.omega = theta, omega
 
         # --- IMU synthesis ---
-        x_raw = int(self.p.accel_raw_fs * math.sin(self.theta)) + random.randint(-self.p.noise_span, self.p.noise_span)
-        y_raw = int(self.p.accel_raw_fs * math.cos(self.theta)) + random.randint(-self.p.noise_span, self.p.noise_span)
+        fs = p.accel_raw_fs
+        sin_th = sin(theta)
+        self._sin_cache = (theta, sin_th)
+        noise = self._noise
+        x_raw = int(fs * sin_th) + noise()
+        y_raw = int(fs * cos(theta)) + noise()
 
-        if self.p.gyro_fs_rad_s > 0:
-            omega_norm = max(-1.0, min(1.0, self.omega / self.p.gyro_fs_rad_s))
-        else:
-            omega_norm = 0.0
-        omega_raw = int(self.p.accel_raw_fs * omega_norm)
+        omega_norm = omega * self._inv_gyro_fs
+        if not -1.0 <= omega_norm <= 1.0:
+            omega_norm = 1.0 if omega_norm > 0.0 else -1.0
+        omega_raw = int(fs * omega_norm)
 
         # clamp to ±RAW_FS
-        lim = self.p.raw_limit
-        x_raw = max(-lim, min(lim, x_raw))
-        y_raw = max(-lim, min(lim, y_raw))
-        omega_raw = max(-lim, min(lim, omega_raw))
-
-        # Per-step log (make this DEBUG if file sizes get too big)
-        self.log.info(
-            "x_raw= %6d y_raw= %6d omega_raw= %6d | theta= %.3f rad, omega= %.3f rad/s | "
-            "motor_accel= %.3f m/s^2 grav_accel= %.3f m/s^2 alpha= %.3f",
-            x_raw, y_raw, omega_raw, self.theta, self.omega, motor_accel, grav_accel, alpha
-        )
-
-        return x_raw, y_raw, omega_raw, self.theta, self.omega
+        lim = p.raw_limit
+        x_raw = clip(x_raw, lim)
+        y_raw = clip(y_raw, lim)
+        omega_raw = clip(omega_raw, lim)
+
+        # Per-step log, decimated; skip building the record when DEBUG is off
+        if i % self._log_every == 0 and self.log.isEnabledFor(logging.DEBUG):
+            self.log.debug(
+                "x_raw= %6d y_raw= %6d omega_raw= %6d | theta= %.3f rad, omega= %.3f rad/s | "
+                "motor_accel= %.3f m/s^2 grav_accel= %.3f m/s^2 alpha= %.3f",
+                x_raw, y_raw, omega_raw, theta, omega, motor_accel, grav_accel, alpha,
+                extra={"i": i},
+            )
+
+        return x_raw, y_raw, omega_raw, theta, omega
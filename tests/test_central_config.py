@@ -17,3 +17,95 @@ def test_controller_callable():
     _, _, _, _, controller, ic = load_simulation_config()
     if controller is not None:
         assert controller(0.1, 0.0, 0.0) is not None
+
+def test_load_toml_is_cached_until_file_changes(tmp_path):
+    import os
+    from simulation.central_config import load_toml
+
+    path = tmp_path / "cfg.toml"
+    path.write_text("[a]\nx = 1\n")
+
+    first = load_toml(str(path))
+    first["a"]["x"] = 99          # callers get a copy; the cache is untouched
+    assert load_toml(str(path)) == {"a": {"x": 1}}
+
+    path.write_text("[a]\nx = 2\n")
+    st = os.stat(path)
+    os.utime(path, (st.st_atime, st.st_mtime + 5))
+
+    assert load_toml(str(path))["a"]["x"] == 2
+
+def test_pickle_cache_skips_parse_until_bytes_change(tmp_path, monkeypatch):
+    from simulation import central_config
+
+    monkeypatch.setenv("CONFIG_PICKLE_CACHE", "1")
+    path = tmp_path / "cfg.toml"
+    path.write_text("[a]\nx = 1\n")
+
+    assert central_config._load_toml_pickled(str(path)) == {"a": {"x": 1}}
+    assert (tmp_path / "cfg.toml.cache.pkl").exists()
+
+    def no_parse(_s):
+        raise AssertionError("TOML parsed despite a valid cache")
+    monkeypatch.setattr(central_config.tomllib, "loads", no_parse)
+    assert central_config._load_toml_pickled(str(path)) == {"a": {"x": 1}}
+
+    monkeypatch.undo()
+    path.write_text("[a]\nx = 2\n")
+    assert central_config._load_toml_pickled(str(path)) == {"a": {"x": 2}}
+
+def test_baked_config_matches_toml(monkeypatch):
+    import importlib.util
+    import os
+    import sys
+    from simulation import central_config
+
+    spec = importlib.util.spec_from_file_location("gen_baked_config", "scripts/gen_baked_config.py")
+    gen = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(gen)
+
+    baked = types.ModuleType("simulation._baked_config")
+    exec(gen.render("config/sim_config.toml"), baked.__dict__)
+    monkeypatch.setitem(sys.modules, "simulation._baked_config", baked)
+
+    from_toml = load_simulation_config()
+    monkeypatch.setenv("USE_BAKED_CONFIG", "1")
+    monkeypatch.setattr(central_config, "load_toml", None)   # must not be reached
+    from_baked = load_simulation_config()
+
+    assert from_baked[:4] == from_toml[:4]
+    assert from_baked[5] == from_toml[5]
+    assert (from_baked[4] is None) == (from_toml[4] is None)
+    if from_baked[4] is not None:
+        assert from_baked[4](0.1, 0.0, 0.0) == from_toml[4](0.1, 0.0, 0.0)
+    assert os.path.realpath("config/sim_config.toml") == baked.SOURCE_PATH
+
+def test_load_simulation_config_is_memoized_per_file(tmp_path):
+    import os
+
+    path = tmp_path / "sim_config.toml"
+    path.write_text(open("config/sim_config.toml", encoding="utf-8").read())
+
+    first = load_simulation_config(str(path))
+    second = load_simulation_config(str(path))
+
+    assert second[0] is first[0]                      # plant shared from the cache
+    assert second[2].perturb is not first[2].perturb  # perturbations are per caller
+    assert second[2].perturb.impulses == first[2].perturb.impulses
+
+    text = path.read_text().replace("DURATION_S", "DURATION_S = 3.5\n_OLD_DURATION_S", 1)
+    path.write_text(text)
+    st = os.stat(path)
+    os.utime(path, (st.st_atime, st.st_mtime + 5))
+
+    assert load_simulation_config(str(path))[3] == 3.5
+
+def test_flc_path_resolves_from_repo_root(tmp_path, monkeypatch):
+    from_repo = load_simulation_config()[4]
+
+    path = tmp_path / "sim_config.toml"
+    path.write_text(open("config/sim_config.toml", encoding="utf-8").read())
+    monkeypatch.chdir(tmp_path)   # the relative FLC_CONFIG_PATH does not exist here
+    controller = load_simulation_config(str(path))[4]
+
+    assert controller(0.1, 0.0, 0.0) == from_repo(0.1, 0.0, 0.0)
@@ -2,16 +2,16 @@
 
 import pytest
 from flc.controller import FLCController
-import tomllib
 
 # ------------------------------------------------------------
 # Fixture: Load your REAL FLC (from config/flc_config.toml)
+# The TOML itself is parsed once per session by conftest.flc_config.
+# FLCController keeps no state between calculate_motor_cmd() calls, so
+# one instance serves every test.
 # ------------------------------------------------------------
-@pytest.fixture
-def flc_controller():
-    with open("config/flc_config.toml", "rb") as f:
-        config = tomllib.load(f)
-    return FLCController(config)
+@pytest.fixture(scope="session")
+def flc_controller(flc_config):
+    return FLCController(flc_config)
 
 
 # ------------------------------------------------------------
@@ -3,31 +3,14 @@ import math
 import types
 import pytest
 
-
-class FakeIMUDevice:
-    """
-    Fake device that returns a programmable sequence of (AX, AY, AZ, GX, GY, GZ).
-    """
-    def __init__(self, seq):
-        self._seq = list(seq)
-        self.closed = False
-
-    def read_all_axes(self):
-        if not self._seq:
-            # keep returning last value if sequence exhausted
-            return self._last
-        self._last = self._seq.pop(0)
-        return self._last
-
-    def close(self):
-        self.closed = True
+from tests.mocks.imu_device import SeqIMUDevice
 
 
 def _make_driver(monkeypatch, seq, *, iir=None, ctrl=None, perf_counter_seq=None, sleep_noop=True):
     import hardware.imu_driver as imu
 
     # Replace underlying device factory in module namespace
-    monkeypatch.setattr(imu, "_IMUDevice", lambda controller_params=None: FakeIMUDevice(seq))
+    monkeypatch.setattr(imu, "_IMUDevice", lambda controller_params=None: SeqIMUDevice(seq))
 
     # Make time deterministic
     if perf_counter_seq is not None:
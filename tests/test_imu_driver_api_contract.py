@@ -1,3 +1,18 @@
+import struct
+
+# Three little-endian int16s (x_raw, y_raw, omega_raw), packed in one C call
+_PACK3 = struct.Struct("<hhh").pack
+
+
+def _cap_int16(v):
+    v = int(v)
+    return v if -32768 <= v <= 32767 else (32767 if v > 0 else -32768)
+
+
+def _pack3(x, y, g):
+    return _PACK3(_cap_int16(x), _cap_int16(y), _cap_int16(g))
+
+
 class FakeSPI:
     """
     Minimal SPI replacement with scripted outputs.
@@ -6,21 +6,27 @@ If you already have test_i2c_stack_integration.py in your repo, you can keep it.
 This file is named differently to avoid collisions.
 """
 import math
+import numpy as np
 import pytest
 
 
 class FakeIMUDevice:
+    # Samples tabulated up front; reads past the end wrap around
+    N_SAMPLES = 256
+
     def __init__(self, controller_params=None):
         self._k = 0
-
-    def read_all_axes(self):
         # produce a slowly changing theta and omega
         # theta via ax changes, omega via gy changes
-        self._k += 1
-        ax = int(2000 * math.sin(self._k * 0.1))
-        az = -16384
-        gy = int(5000 * math.cos(self._k * 0.07))
-        return (ax, 0, az, 0, gy, 0)
+        k = np.arange(1, self.N_SAMPLES + 1)
+        ax = (2000 * np.sin(k * 0.1)).astype(int).tolist()
+        gy = (5000 * np.cos(k * 0.07)).astype(int).tolist()
+        self._samples = [(a, 0, -16384, 0, g, 0) for a, g in zip(ax, gy)]
+
+    def read_all_axes(self):
+        k = self._k
+        self._k = k + 1 if k + 1 < self.N_SAMPLES else 0
+        return self._samples[k]
 
     def close(self):
         pass
@@ -0,0 +1,43 @@
+# tests/test_mock_simulation.py
+
+import numpy as np
+from tests.mocks.simulation import CarriageSimulator, SimParams
+
+
+def _params():
+    # noise_span=0: step() and the batch paths draw noise from different streams
+    return SimParams(50.0, 4.0, 0.3, 0.0, 0.6, 1.0, 2.0, 9.81, 4.0, 16384, 0)
+
+
+def _sim(tmp_path, name):
+    sim = CarriageSimulator(_params(), log_path=str(tmp_path / f"{name}.log"))
+    sim.set_motor_cmd(0.4)
+    return sim
+
+
+def test_step_prebake_and_run_batch_give_same_frames(tmp_path):
+    n = 150  # long enough to reach the +2 rad hold-at-limit
+
+    sim = _sim(tmp_path, "step")
+    stepped = np.array([sim.step() for _ in range(n)])
+
+    sim = _sim(tmp_path, "prebake")
+    sim.prebake(n)
+    prebaked = np.array([sim.step() for _ in range(n)])
+
+    sim = _sim(tmp_path, "batch")
+    batched = np.column_stack(sim.run_batch(n))
+
+    assert np.array_equal(stepped, prebaked)
+    assert np.array_equal(stepped, batched)
+    assert stepped[-1, 3] == 2.0
+    assert (sim.theta, sim.omega) == (2.0, 0.0)
+
+
+def test_run_batch_rejects_short_command_array(tmp_path):
+    import pytest
+
+    sim = _sim(tmp_path, "short")
+    with pytest.raises(ValueError):
+        sim.run_batch(10, motor_cmd_arr=[0.1] * 9)
+    assert (sim.theta, sim.omega, sim.motor_cmd) == (0.3, 0.0, 0.4)
@@ -0,0 +1,47 @@
+# tests/test_monte_carlo.py
+
+import random
+import numpy as np
+from simulation.monte_carlo import run_monte_carlo
+
+def test_monte_carlo_is_reproducible_serial_and_parallel():
+    serial = run_monte_carlo(4, seed=10, max_workers=1, duration=6.0)
+    again = run_monte_carlo(4, seed=10, max_workers=1, duration=6.0)
+    parallel = run_monte_carlo(4, seed=10, max_workers=2, duration=6.0)
+
+    assert set(serial) == {"zeta", "overshoot", "settling"}
+    assert serial["zeta"].shape == (4,)
+    for name in serial:
+        assert np.array_equal(serial[name], again[name])
+        assert np.array_equal(serial[name], parallel[name])
+
+    # Different seeds draw different disturbances
+    other = run_monte_carlo(4, seed=20, max_workers=1, duration=6.0)
+    assert not np.array_equal(serial["overshoot"], other["overshoot"])
+
+def test_monte_carlo_does_not_reseed_global_random():
+    after = []
+    for caller_seed in (1, 2):
+        random.seed(caller_seed)
+        run_monte_carlo(2, seed=10, max_workers=1, duration=1.0)
+        after.append(random.random())
+
+    # The caller's random stream carries on instead of being reset per trial
+    assert after[0] != after[1]
+
+def test_monte_carlo_trials_get_one_impulse_and_one_step():
+    from simulation.monte_carlo import _config_simulator
+    from simulation.plot_sim_results import monte_carlo_test
+
+    sims = []
+    def factory():
+        sims.append(_config_simulator("config/sim_config.toml"))
+        return sims[-1]
+
+    monte_carlo_test(factory, N=3, seed=10, max_workers=1, duration=1.0)
+
+    assert len(sims) == 3
+    for sim in sims:
+        p = sim.perturb
+        assert len(p.impulses) == 1 and len(p.steps) == 1
+        assert not (p.sine_waves or p.rnd_phase_sine or p.random_kicks)
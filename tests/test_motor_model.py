@@ -34,3 +34,61 @@ def test_gravity_torque_symmetry():
     tau2 = sim._gravity_torque()
 
     assert abs(tau1 + tau2) < 1e-9
+
+def test_dc_motor_gearbox_back_emf_and_saturation():
+    from simulation.carriage_simulator import DCMotorGearbox, PlantParams, SimConfig
+
+    motor = DCMotorGearbox(V_max=12.0, R=2.0, Kv=0.02, Kt=0.02, gear=50.0,
+                           eta=0.8, I_max=3.0)
+
+    # Stall: current limited to I_max
+    assert np.isclose(motor.torque(1.0, 0.0), 0.02 * 3.0 * 50.0 * 0.8)
+    # Back-EMF reduces torque while moving in the driven direction
+    assert motor.torque(1.0, 8.0) < motor.torque(1.0, 0.0)
+    # At no-load speed the torque vanishes
+    assert np.isclose(motor.torque(1.0, 12.0 / (0.02 * 50.0)), 0.0)
+
+    plant = PlantParams(I=0.42, m=1.088, r=0.622, b=0.004)
+    sim = CarriageSimulator(plant, motor, SimConfig(dt=0.002, steps_per_log=10),
+                            lambda th, om, t: -1.0 if th > 0 else 1.0)
+    sim.reset(0.05, 0.0)
+    sim.run(1.0)
+    assert np.all(np.isfinite(sim.log_theta))
+
+def test_dc_motor_kernel_matches_python_loop(monkeypatch):
+    from simulation import kernels
+    from simulation.carriage_simulator import DCMotorGearbox, PDController, PlantParams, SimConfig
+
+    limited = DCMotorGearbox(V_max=12.0, R=2.0, Kv=0.02, Kt=0.02, gear=50.0,
+                             eta=0.8, I_max=3.0, tau_max=0.05, n_motors=2)
+    unlimited = DCMotorGearbox(V_max=12.0, R=2.0, Kv=0.02, Kt=0.02, gear=50.0)   # inf limits
+    plant = PlantParams(I=0.42, m=1.088, r=0.622, b=0.004)
+
+    for motor in (limited, unlimited):
+        runs = {}
+        for use_kernel in (False, True):
+            # Compiled when Numba is installed, plain Python otherwise
+            monkeypatch.setattr(kernels, "HAVE_NUMBA", use_kernel)
+            sim = CarriageSimulator(plant, motor, SimConfig(dt=0.002, steps_per_log=3),
+                                    PDController(Kp=-4.0, Kd=-0.5))
+            sim.reset(0.2, 0.0)
+            sim.run(1.5)
+            runs[use_kernel] = sim
+
+        assert np.array_equal(runs[True].log_theta, runs[False].log_theta)
+        assert np.array_equal(runs[True].log_tau_m, runs[False].log_tau_m)
+        assert runs[True].last_sample() == runs[False].last_sample()
+
+def test_dc_motor_kernel_compiles_with_infinite_limits():
+    import pytest
+    pytest.importorskip("numba")
+    from simulation import kernels
+
+    assert kernels.HAVE_NUMBA
+    tau_ext = np.zeros(50)
+    theta, omega, cmd, tau_m, tau_g = kernels.integrate_pd_dc(
+        0.2, 0.0, 0.002, tau_ext, -4.0, -0.5, 6.6, 1.0, 0.002 / 0.42,
+        12.0, 2.0, 0.02, 0.02, 50.0, 1.0, np.inf, np.inf, 1)
+
+    assert kernels.integrate_pd_dc.signatures   # ran as compiled code
+    assert np.all(np.isfinite(theta)) and np.all(np.isfinite(tau_m))
@@ -2,7 +2,8 @@
 
 import numpy as np
 from simulation.plot_sim_results import (
-    compute_overshoot, compute_settling_time, estimate_damping_ratio, compute_rise_time
+    compute_overshoot, compute_settling_time, estimate_damping_ratio, compute_rise_time,
+    compute_metrics,
 )
 
 def test_metric_functions():
@@ -13,3 +14,67 @@ def test_metric_functions():
     assert compute_settling_time(t, theta) >= 0
     assert 0.0 <= estimate_damping_ratio(theta, t) <= 1.0
     assert compute_rise_time(t, theta) >= 0
+
+def test_settling_time_is_first_sample_after_last_excursion():
+    t = np.arange(6) * 0.1
+    theta = np.array([2.0, 1.0, 1.5, 1.01, 0.99, 1.0])
+
+    assert np.isclose(compute_settling_time(t, theta), 0.3)
+    assert compute_settling_time(t, np.ones(6)) == 0.0
+    # Negative final value: the band is empty, so the run never settles
+    assert compute_settling_time(t, -np.ones(6)) == t[-1]
+
+def test_damping_and_rise_time_on_known_response():
+    zeta = 0.2
+    wn = 2 * np.pi
+    wd = wn * np.sqrt(1 - zeta**2)
+    t = np.linspace(0, 5, 5001)
+    theta = np.exp(-zeta * wn * t) * np.cos(wd * t - np.pi / 2)
+
+    assert np.isclose(estimate_damping_ratio(theta, t), zeta, atol=1e-3)
+
+    ramp = np.minimum(t, 1.0)
+    assert np.isclose(compute_rise_time(t, ramp), 0.8, atol=2e-3)
+    assert np.isnan(compute_rise_time(t, -np.ones_like(t)))
+
+def test_compute_metrics_matches_individual_metrics():
+    t = np.linspace(0, 5, 500)
+    for theta in (0.3 * np.exp(-0.4 * t) * np.sin(4 * t), np.minimum(t, 1.0), -np.ones_like(t)):
+        m = compute_metrics(list(t), list(theta))
+        assert m["overshoot"] == compute_overshoot(theta)
+        assert m["settling"] == compute_settling_time(t, theta)
+        assert m["zeta"] == estimate_damping_ratio(theta, t)
+        assert np.array_equal(m["rise"], compute_rise_time(t, theta), equal_nan=True)
+
+def _short_sim():
+    from simulation.carriage_simulator import CarriageSimulator, PlantParams, MotorParams, SimConfig
+
+    sim = CarriageSimulator(PlantParams(I=0.12, m=1.088, r=0.622),
+                            MotorParams(0.16, 2, 0.012, 0.6096),
+                            SimConfig(dt=0.004, steps_per_log=5))
+    sim.reset(theta=0.05)
+    return sim
+
+def test_monte_carlo_test_is_seeded_and_parallel_safe():
+    from simulation.plot_sim_results import monte_carlo_test
+
+    serial = monte_carlo_test(_short_sim, N=3, seed=5, max_workers=1)
+    parallel = monte_carlo_test(_short_sim, N=3, seed=5, max_workers=2)
+    closure = monte_carlo_test(lambda: _short_sim(), N=3, seed=5)   # not picklable: serial
+
+    for name in ("zeta", "overshoot", "settling"):
+        assert serial[name].shape == (3,)
+        assert np.array_equal(serial[name], parallel[name])
+        assert np.array_equal(serial[name], closure[name])
+
+def test_monte_carlo_test_saves_trajectories(tmp_path):
+    from simulation.plot_sim_results import monte_carlo_test
+
+    path = tmp_path / "traj.npz"
+    res = monte_carlo_test(_short_sim, N=2, seed=5, max_workers=1, save_trajectories_npz=path)
+    plain = monte_carlo_test(_short_sim, N=2, seed=5, max_workers=1)
+
+    with np.load(path) as data:
+        assert data["theta"].shape == data["t"].shape == (2, 1000)   # 20 s / (0.004 s * 5)
+        assert np.all(data["theta"][:, 0] > 0)
+    assert np.array_equal(res["settling"], plain["settling"])
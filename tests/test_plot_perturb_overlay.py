@@ -1,7 +1,7 @@
 # tests/test_plot_perturb_overlay.py
 
 from simulation.plot_sim_results import overlay_perturbations, annotate_perturbations
-from simulation.carriage_simulator import PlantParams, MotorParams, CarriageSimulator
+from simulation.carriage_simulator import PlantParams, MotorParams, SimConfig, CarriageSimulator
 import matplotlib.pyplot as plt
 
 def test_overlay_and_annotations_do_not_crash():
@@ -17,3 +17,89 @@ def test_overlay_and_annotations_do_not_crash():
 
     overlay_perturbations(ax, ax_ext, sim)
     annotate_perturbations(ax, sim)
+
+def test_impulse_markers_drawn_in_one_collection():
+    plant = PlantParams(I=0.12, m=1.088, r=0.622)
+    motor = MotorParams(0.16, 2, 0.012, 0.6096)
+
+    sim = CarriageSimulator(plant, motor, SimConfig(dt=0.002, steps_per_log=1))
+    sim.reset()
+    sim.perturb.impulses.clear()
+    sim.perturb.add_impulse(0.2, 0.5)
+    sim.perturb.add_impulse(0.6, 0.5)
+    sim.run(1.0)
+
+    fig, ax = plt.subplots()
+    overlay_perturbations(ax, ax.twinx(), sim)
+
+    # Each impulse rises and falls back: two markers per impulse
+    assert len(ax.collections) == 1
+    assert len(ax.collections[0].get_segments()) == 4
+    plt.close(fig)
+
+def test_plot_sim_results_caps_points_per_line(monkeypatch):
+    from simulation.plot_sim_results import plot_sim_results
+
+    plant = PlantParams(I=0.12, m=1.088, r=0.622)
+    motor = MotorParams(0.16, 2, 0.012, 0.6096)
+    sim = CarriageSimulator(plant, motor, SimConfig(dt=0.002, steps_per_log=1))
+    sim.reset(theta=0.1)
+    sim.run(2.0)   # 1000 logged samples
+
+    monkeypatch.setattr(plt, "show", lambda: None)
+    plot_sim_results(sim, max_points=300)
+
+    ax = plt.gcf().axes[0]
+    assert all(len(line.get_xdata()) <= 300 for line in ax.get_lines())
+    plt.close("all")
+
+def test_batch_plots_reuse_one_offscreen_figure(tmp_path):
+    from simulation import plot_sim_results as psr
+
+    plant = PlantParams(I=0.12, m=1.088, r=0.622)
+    motor = MotorParams(0.16, 2, 0.012, 0.6096)
+    figures = []
+    for theta0 in (0.1, -0.2):
+        sim = CarriageSimulator(plant, motor)
+        sim.reset(theta=theta0)
+        sim.run(12.0)   # past the default impulse (5 s) and into the step (10 s)
+        out = tmp_path / f"run_{theta0}.png"
+        psr.plot_sim_results(sim, save_path=str(out), show=False)
+        assert out.stat().st_size > 0
+        figures.append(psr._FIG_CACHE["batch"]["fig"])
+
+    assert figures[0] is figures[1]
+    ax = figures[1].axes[0]
+    assert ax.get_lines()[0].get_ydata()[0] < 0        # data from the second run
+    assert len(ax.patches) == 1                         # overlays not accumulated
+
+def test_batch_plot_without_annotations_skips_torque_axis(tmp_path):
+    from simulation import plot_sim_results as psr
+
+    sim = CarriageSimulator(PlantParams(I=0.12, m=1.088, r=0.622), MotorParams(0.16, 2, 0.012, 0.6096))
+    sim.reset(theta=0.1)
+    sim.run(6.0)
+    psr.plot_sim_results(sim, save_path=str(tmp_path / "plain.png"), show=False, annotations=False)
+
+    fig = psr._FIG_CACHE["batch-plain"]["fig"]
+    ax = fig.axes[0]
+    assert len(fig.axes) == 2                           # main + motor command only
+    assert not ax.collections and not ax.texts
+
+def test_batch_plot_rescales_external_torque_axis(tmp_path):
+    from simulation import plot_sim_results as psr
+
+    plant = PlantParams(I=0.12, m=1.088, r=0.622)
+    motor = MotorParams(0.16, 2, 0.012, 0.6096)
+    limits = []
+    for mag in (5.0, 0.01):
+        sim = CarriageSimulator(plant, motor, SimConfig(dt=0.002, steps_per_log=1))
+        sim.reset()
+        sim.perturb.impulses.clear()
+        sim.perturb.steps.clear()
+        sim.perturb.add_step(0.2, 0.6, mag)
+        sim.run(1.0)
+        psr.plot_sim_results(sim, save_path=str(tmp_path / f"step_{mag}.png"), show=False)
+        limits.append(psr._FIG_CACHE["batch"]["ax_ext"].get_ylim())
+
+    assert limits[1][1] < 0.1                           # not the 5 Nm run's limits
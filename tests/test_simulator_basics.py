@@ -1,6 +1,7 @@
 # tests/test_simulator_basic.py
 
 import math
+import numpy as np
 from simulation.carriage_simulator import (
     CarriageSimulator, PlantParams, MotorParams, SimConfig
 )
@@ -25,3 +26,153 @@ def test_sim_run_basic():
 
     # Gravity torque should be nonzero at nonzero theta
     assert any(abs(tg) > 0 for tg in sim.log_tau_g)
+
+def test_run_logs_once_per_block():
+    plant = PlantParams(I=0.12, m=1.088, r=0.622)
+    motor = MotorParams(0.16, 2, 0.012, 0.6096)
+    cfg = SimConfig(dt=0.002, steps_per_log=10)
+
+    sim = CarriageSimulator(plant, motor, cfg)
+    sim.reset()
+    sim.run(0.205)   # 102 steps -> 10 full blocks + 2 trailing steps
+
+    assert len(sim.log_t) == 10
+    assert math.isclose(sim.log_t[-1], 0.2, rel_tol=1e-9)
+    assert math.isclose(sim.t, 102 * 0.002, rel_tol=1e-9)
+
+def test_step_logs_every_steps_per_log():
+    plant = PlantParams(I=0.12, m=1.088, r=0.622)
+    motor = MotorParams(0.16, 2, 0.012, 0.6096)
+    cfg = SimConfig(dt=0.002, steps_per_log=10)
+
+    stepped = CarriageSimulator(plant, motor, cfg)
+    stepped.reset(theta=0.1)
+    for _ in range(100):
+        stepped.step()
+
+    ran = CarriageSimulator(plant, motor, cfg)
+    ran.reset(theta=0.1)
+    ran.run(0.2)
+
+    assert len(stepped.log_t) == 10
+    assert np.allclose(stepped.log_t, ran.log_t)
+    assert np.allclose(stepped.log_theta, ran.log_theta)
+
+def test_inline_pd_matches_callback():
+    from simulation.carriage_simulator import PDController
+
+    plant = PlantParams(I=0.12, m=1.088, r=0.622)
+    motor = MotorParams(0.16, 2, 0.012, 0.6096)
+    cfg = SimConfig(dt=0.002, steps_per_log=5)
+    pd = PDController(Kp=-2.0, Kd=-0.4)
+
+    inline = CarriageSimulator(plant, motor, cfg, pd)
+    callback = CarriageSimulator(plant, motor, cfg, lambda th, om, t: pd(th, om, t))
+    assert inline.ctrl_kind == "pd"
+    assert callback.ctrl_kind == "callback"
+
+    for sim in (inline, callback):
+        sim.reset(theta=0.1)
+        sim.run(1.0)
+
+    assert np.array_equal(inline.log_theta, callback.log_theta)
+
+def test_reassigning_controller_replaces_inline_pd():
+    from simulation.carriage_simulator import PDController
+
+    plant = PlantParams(I=0.12, m=1.088, r=0.622)
+    motor = MotorParams(0.16, 2, 0.012, 0.6096)
+    sim = CarriageSimulator(plant, motor, SimConfig(dt=0.002, steps_per_log=1),
+                            PDController(Kp=-2.0, Kd=-0.4))
+    sim.controller = lambda th, om, t: 1.0
+    sim.reset(theta=0.1)
+    sim.run(0.01)
+    sim.step()
+
+    assert sim.ctrl_kind == "callback"
+    assert np.all(sim.log_cmd == 1.0)
+
+def test_no_log_mode_keeps_final_state():
+    plant = PlantParams(I=0.12, m=1.088, r=0.622)
+    motor = MotorParams(0.16, 2, 0.012, 0.6096)
+
+    ref = CarriageSimulator(plant, motor, SimConfig(dt=0.002, steps_per_log=10))
+    ref.reset(theta=0.1)
+    ref.run(0.5)
+
+    sim = CarriageSimulator(plant, motor, SimConfig(dt=0.002, log=False))
+    sim.reset(theta=0.1)
+    sim.run(0.5)
+
+    assert len(sim.log_t) == 0
+    assert sim.last_sample() == ref.last_sample()
+    assert sim.last_sample()[1] == ref.log_theta[-1]
+
+def test_time_is_derived_from_step_count():
+    plant = PlantParams(I=0.12, m=1.088, r=0.622)
+    motor = MotorParams(0.16, 2, 0.012, 0.6096)
+    sim = CarriageSimulator(plant, motor, SimConfig(dt=0.002, log=False))
+    sim.reset(t=1.0)
+
+    # 0.3 / 0.002 evaluates to 149.99999999999997 in floating point
+    sim.run(0.3)
+    sim.run(4.7)
+
+    assert sim.t == 1.0 + 2500 * 0.002
+
+def test_kernel_path_matches_python_loop(monkeypatch):
+    from simulation import kernels
+    from simulation.carriage_simulator import PDController
+
+    plant = PlantParams(I=0.12, m=1.088, r=0.622, b=0.05)
+    motor = MotorParams(0.16, 2, 0.012, 0.6096)
+    cfg = SimConfig(dt=0.002, steps_per_log=7)
+
+    runs = {}
+    for use_kernel in (False, True):
+        # Compiled when Numba is installed, plain Python otherwise
+        monkeypatch.setattr(kernels, "HAVE_NUMBA", use_kernel)
+        sim = CarriageSimulator(plant, motor, cfg, PDController(Kp=-2.0, Kd=-0.4))
+        sim.reset(theta=0.1)
+        sim.run(0.4)
+        sim.run(0.303)
+        runs[use_kernel] = sim
+
+    py, jit = runs[False], runs[True]
+    assert np.array_equal(jit.log_t, py.log_t)
+    for name in ("log_theta", "log_omega", "log_cmd", "log_tau_m", "log_tau_g", "log_tau_ext"):
+        assert len(getattr(jit, name)) == len(getattr(py, name))
+        assert all(math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-12)
+                   for a, b in zip(getattr(jit, name), getattr(py, name)))
+    assert jit.t == py.t
+    assert all(math.isclose(a, b, rel_tol=1e-9, abs_tol=1e-12)
+               for a, b in zip(jit.last_sample(), py.last_sample()))
+
+def test_logs_are_numpy_views_that_survive_growth():
+    plant = PlantParams(I=0.12, m=1.088, r=0.622)
+    motor = MotorParams(0.16, 2, 0.012, 0.6096)
+    sim = CarriageSimulator(plant, motor, SimConfig(dt=0.002, steps_per_log=1))
+    sim.reset(theta=0.1)
+
+    sim.run(0.3)
+    first = sim.log_theta
+    sim.run(0.3)   # grows the buffer past its initial capacity
+
+    assert isinstance(sim.log_t, np.ndarray)
+    assert len(sim.log_t) == len(sim.log_cmd) == 300
+    assert np.allclose(sim.log_t, (np.arange(300) + 1) * 0.002)
+    assert np.array_equal(sim.log_theta[:150], first)
+
+    sim.reset()
+    assert len(sim.log_theta) == 0
+    assert len(first) == 150
+
+def test_run_presizes_log_buffer():
+    plant = PlantParams(I=0.12, m=1.088, r=0.622)
+    motor = MotorParams(0.16, 2, 0.012, 0.6096)
+    sim = CarriageSimulator(plant, motor, SimConfig(dt=0.002, steps_per_log=2))
+    sim.reset(theta=0.1)
+    sim.run(4.0)   # 2000 steps -> 1000 log samples
+
+    assert len(sim.log_t) == 1000
+    assert sim._log.shape == (7, 1000)
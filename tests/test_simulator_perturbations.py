@@ -37,3 +37,120 @@ def test_step_applied_region():
     region = (t >= 0.2) & (t <= 0.4)
     # Require step to be applied on all but perhaps the first dt interval
     assert np.allclose(tau[region][1:], 0.03, atol=1e-4)
+
+def test_sample_matches_scalar_get():
+    from simulation.perturbations import Perturbation
+
+    p = Perturbation()
+    p.add_impulse(0.1, 0.5)
+    p.add_step(0.2, 0.4, 0.03)
+    p.add_step(0.3, 0.45, -0.01)
+    p.add_sine(amplitude=0.02, freq=1.5, phase=0.3, t_start=0.05, t_end=0.35)
+    p.add_random_phase_sine(amplitude=0.01, freq=0.7)
+
+    ts = np.arange(250) * 0.002
+    expected = np.array([p.get(t) for t in ts])
+
+    assert np.allclose(p.sample(ts), expected)
+    assert np.allclose(p.sample(ts), expected)   # reuses the packed arrays
+
+    # Direct edits to the source lists take effect after refresh()
+    p.steps.clear()
+    p.refresh()
+    assert np.allclose(p.sample(ts), [p.get(t) for t in ts])
+    assert not np.allclose(p.sample(ts), expected)
+
+def test_indexed_get_matches_linear_scan():
+    from simulation.perturbations import Perturbation
+
+    p = Perturbation()
+    for t0 in (0.1, 0.25, 0.25, 0.401):
+        p.add_impulse(t0, 0.5)
+    p.add_step(0.2, 0.4, 0.03)
+    p.add_step(0.3, 0.6, -0.01)
+
+    def scan(t):
+        tau = sum(m for t0, m in p.impulses if abs(t - t0) < 1e-6)
+        return tau + sum(m for t0, t1, m in p.steps if t0 <= t <= t1)
+
+    ts = [k * 0.002 for k in range(400)] + [0.401, 0.2, 0.6]
+    p.set_timestep(0.002)
+    assert np.allclose([p.get(t) for t in ts], [scan(t) for t in ts])
+    assert np.isclose(p.get(0.25), 1.0 + 0.03)
+
+def test_fused_source_kernel_matches_numpy_path(monkeypatch):
+    from simulation import kernels
+    from simulation.perturbations import Perturbation
+
+    p = Perturbation()
+    p.add_impulse(0.1, 0.5)
+    p.add_step(0.2, 0.4, 0.03)
+    p.add_step(0.3, 0.6, -0.01)
+    p.add_sine(amplitude=0.02, freq=1.5, t_start=0.05, t_end=0.5)
+    ts = np.arange(400) * 0.002
+
+    expected = p.sample(ts)
+    # Without Numba installed this exercises the kernel as plain Python
+    monkeypatch.setattr(kernels, "HAVE_NUMBA", True)
+    assert np.allclose(p.sample(ts), expected)
+
+def test_many_overlapping_steps_match_linear_scan():
+    from simulation.perturbations import Perturbation
+
+    rng = np.random.default_rng(7)
+    p = Perturbation()
+    for t0, width, mag in zip(rng.uniform(0, 9, 40), rng.uniform(0.1, 3, 40), rng.normal(0, 0.05, 40)):
+        p.add_step(float(t0), float(t0 + width), float(mag))
+
+    ts = np.concatenate((np.arange(0, 12, 0.01), [s[0] for s in p.steps], [s[1] for s in p.steps]))
+    scan = [sum(m for t0, t1, m in p.steps if t0 <= t <= t1) for t in ts]
+
+    assert np.allclose([p.get(t) for t in ts], scan, atol=1e-12)
+    assert np.allclose(p.sample(ts), scan, atol=1e-12)
+
+def test_refresh_picks_up_in_place_edits():
+    from simulation.perturbations import Perturbation
+
+    p = Perturbation()
+    p.set_timestep(0.002)
+    p.add_impulse(0.1, 0.5)
+    p.add_step(0.2, 0.4, 0.03)
+    ts = np.arange(250) * 0.002
+    [p.get(t) for t in ts]   # build the scalar lookups
+
+    p.impulses[0] = (0.2, 0.5)
+    p.steps[0] = (0.3, 0.4, 0.01)
+    p.refresh()
+    assert np.allclose([p.get(t) for t in ts], p.sample(ts))
+    assert p.get(0.1) == 0.0
+
+def test_noise_follows_random_seed():
+    import random
+    from simulation.perturbations import Perturbation
+
+    ts = np.arange(100) * 0.002
+    runs = []
+    for _ in range(2):
+        random.seed(11)
+        p = Perturbation()
+        p.add_noise(0.01)
+        runs.append(p.sample(ts))
+
+    assert np.array_equal(runs[0], runs[1])
+
+def test_source_kernel_matches_numpy_path(monkeypatch):
+    from simulation import kernels
+    from simulation.perturbations import Perturbation
+
+    p = Perturbation()
+    p.add_impulse(0.1, 0.5)
+    p.add_step(0.2, 0.4, 0.03)
+    p.add_sine(amplitude=0.02, freq=1.5, phase=0.3)   # t_end = inf
+    p.add_sine(amplitude=0.01, freq=4.0, t_start=0.05, t_end=0.35)
+    ts = np.arange(300) * 0.002
+
+    # Without Numba installed the kernel runs as plain Python
+    monkeypatch.setattr(kernels, "HAVE_NUMBA", True)
+    fused = p.sample(ts)
+    monkeypatch.setattr(kernels, "HAVE_NUMBA", False)
+    assert np.allclose(fused, p.sample(ts), rtol=0, atol=1e-15)
@@ -36,3 +36,17 @@ def test_no_nan_outputs():
 
     assert not any(np.isnan(sim.log_theta))
     assert not any(np.isnan(sim.log_omega))
+
+def test_stiff_damping_decays_exactly():
+    # b/I*dt = 3.3 would make explicit Euler diverge; the closed-form decay must not
+    plant = PlantParams(I=0.12, m=0.0, r=0.622, b=200.0)
+    motor = MotorParams(0.16, 2, 0.012, 0.6096)
+    sim = CarriageSimulator(plant, motor, SimConfig(dt=0.002, steps_per_log=1))
+
+    sim.reset(0.0, 1.0)
+    sim.perturb.impulses.clear()
+    sim.perturb.steps.clear()
+    sim.run(0.02)
+
+    expected = np.exp(-200.0 / 0.12 * 0.002 * np.arange(1, 11))
+    assert np.allclose(sim.log_omega, expected)
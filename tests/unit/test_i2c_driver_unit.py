@@ -16,7 +16,7 @@ def _install_fake_pigpio(monkeypatch):
         def i2c_open(self, bus, addr, flags=0): return 1
         def i2c_close(self, h): return None
         def i2c_read_byte_data(self, h, reg): return 0
-        def i2c_read_i2c_block_data(self, h, reg, count): return (count, bytes([0] * count))
+        def i2c_read_i2c_block_data(self, h, reg, count): return (count, bytes(count))
         def i2c_write_byte_data(self, h, reg, val): return None
         def stop(self): return None
 
@@ -36,7 +36,7 @@ def _install_fake_mock_pigpio(monkeypatch):
         def i2c_open(self, bus, addr, flags=0): return 1
         def i2c_close(self, h): return None
         def i2c_read_byte_data(self, h, reg): return 0
-        def i2c_read_i2c_block_data(self, h, reg, count): return (count, bytes([0] * count))
+        def i2c_read_i2c_block_data(self, h, reg, count): return (count, bytes(count))
         def i2c_write_byte_data(self, h, reg, val): return None
         def stop(self): return None
 
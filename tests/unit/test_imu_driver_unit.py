@@ -2,34 +2,17 @@
 import math
 import pytest
 
-
-class _StubDevSeq:
-    """Stub IMU device returning a sequence of (AX, AY, AZ, GX, GY, GZ)."""
-
-    def __init__(self, controller_params=None, seq=None, **_kw):
-        self._seq = list(seq or [(0, 0, -16384, 0, 0, 0)])
-        self._i = 0
-
-    def read_all_axes(self):
-        if self._i < len(self._seq):
-            v = self._seq[self._i]
-            self._i += 1
-        else:
-            v = self._seq[-1]
-        return v
-
-    def close(self):
-        return None
+from tests.mocks.imu_device import SeqIMUDevice
 
 
 def _patch_underlying_device(monkeypatch, imu_mod, seq):
     # Preferred seam: module-level factory/class _IMUDevice
     if hasattr(imu_mod, "_IMUDevice"):
-        monkeypatch.setattr(imu_mod, "_IMUDevice", lambda controller_params=None: _StubDevSeq(seq=seq))
+        monkeypatch.setattr(imu_mod, "_IMUDevice", lambda controller_params=None: SeqIMUDevice(seq))
         return
     # Fallback: IMU_Driver may directly construct MPU6050Driver
     if hasattr(imu_mod, "MPU6050Driver"):
-        monkeypatch.setattr(imu_mod, "MPU6050Driver", lambda *a, **k: _StubDevSeq(seq=seq), raising=True)
+        monkeypatch.setattr(imu_mod, "MPU6050Driver", lambda *a, **k: SeqIMUDevice(seq), raising=True)
         return
     raise RuntimeError("Cannot patch underlying IMU device constructor in imu_driver.")
 